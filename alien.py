@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import random
+from itertools import chain
 
 import pygame
 from pygame.sprite import Sprite
@@ -8,6 +8,9 @@ from typing import TYPE_CHECKING, Optional
 
 from bullet import AlienBullet
 from bonuses import BonusType, BonusSprite, BonusesInfo
+from image_cache import surface_cache
+from spatial_hash import SpatialHash, groupcollide
+from pool import SpritePool, kill_all
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
@@ -19,16 +22,36 @@ class AlienFleet:
 
         self.aliens = pygame.sprite.Group()
         self.screen = ai_game.screen
+        self.screen_rect = ai_game.screen.get_rect()
         self.settings = ai_game.settings
         self.scoreboard = ai_game.ui
         self.stats = ai_game.stats
+        self.shoot_rng = ai_game.rng.stream('alien_shoot')
+        self.drop_rng = ai_game.rng.stream('bonus_drop')
+        self.bonus_rng = ai_game.rng.stream('bonus_type')
 
         self.bullets = pygame.sprite.Group()
         self.bonuses = pygame.sprite.Group()
-
-        pygame.time.set_timer(self.settings.alien_shoot_event, self.settings.alien_shoot_timer_factor, loops=1)
-
-        self.create_fleet()
+        self.bullet_pool = SpritePool(AlienBullet, ai_game)
+        self.bonus_pool = SpritePool(BonusSprite, ai_game)
+        self.grid = SpatialHash(self.settings.collision_cell_size)
+
+        self.schedule_shot()
+
+        self.engine = None
+        self.alien_slots: dict[tuple[int, int], Alien] = {}
+        self.frontline: dict[int, Alien] = {}
+        self._columns: dict[int, list[Alien]] = {}
+        self._shooters: Optional[tuple[Alien, ...]] = None
+        self._extents: Optional[tuple[Alien, Alien, Alien]] = None
+        if not self.settings.fast_start:
+            self.create_fleet()
+        if self.settings.fleet_backend == 'numpy':
+            # numpy is only imported when the backend is used
+            from fleet_engine import NumpyFleetEngine
+            self.engine = NumpyFleetEngine(self)
+            # The engine answers the collision queries from its arrays
+            self.grid = self.engine
 
     def create_fleet(self):
         alien = Alien(self)
@@ -56,6 +79,9 @@ class AlienFleet:
             for alien_num in range(1, number_aliens_x):
                 self._create_alien(alien_num, row, spacing_x, spacing_y)
 
+        self.grid.rebuild(self.aliens)
+        self.build_frontline()
+
     def _create_alien(self, alien_num, row, spacing_x, spacing_y):
         alien = Alien(self, row, alien_num)
         alien_width, alien_height = alien.rect.size
@@ -63,136 +89,194 @@ class AlienFleet:
         alien.rect.x = alien.x
         alien.rect.y = alien.y = self.settings.start_offset_y + (spacing_y * row)
         self.aliens.add(alien)
+        self.alien_slots[row, alien_num] = alien
 
     def clear_aliens(self):
         self.aliens.empty()
-        self.bullets.empty()
-        self.bonuses.empty()
+        kill_all(self.bullets)
+        kill_all(self.bonuses)
+        self.grid.clear()
+        self.build_frontline()
+
+    def sync_positions(self):
+        # The numpy engine moves aliens in its arrays, sprites are updated before they are read
+        if self.engine:
+            self.engine.write_back()
 
     def update_screen(self):
-        self.aliens.draw(self.screen)
-        for bullet in self.bullets.sprites():
-            bullet.draw_bullet()
-        self.bonuses.draw(self.screen)
+        self.sync_positions()
+        return self.screen.blits([(sprite.image, sprite.rect)
+                                  for sprite in chain(self.aliens, self.bullets, self.bonuses)])
 
     def update_aliens(self):
-        self._check_fleet_edges()
-        self.aliens.update()
+        if self.engine:
+            self.engine.update()
+        else:
+            self._check_fleet_edges()
+            self.aliens.update(self.settings.alien_speed_factor * self.settings.fleet_direction)
+            self.grid.update(self.aliens)
         self._update_bullets()
         self._update_bonuses()
 
-        if pygame.sprite.spritecollideany(self.ai_game.ship, self.aliens):
+        if self.grid.collide(self.ai_game.ship.rect):
             self.ai_game.game_over()
 
         self._check_aliens_bottom()
         self._check_bullets_collision()
 
+    def schedule_shot(self):
+        # A timer of 0 turns alien shooting off, as pygame.time.set_timer did
+        if self.settings.alien_shoot_timer_factor <= 0:
+            self.ai_game.timers.cancel('alien_shoot')
+            return
+        self.ai_game.timers.schedule(self.settings.alien_shoot_timer_factor / 1000,
+                                     self.fire_random_bullet, key='alien_shoot')
+
     def fire_random_bullet(self):
-        pygame.time.set_timer(self.settings.alien_shoot_event,
-                              self.settings.alien_shoot_timer_factor, loops=1)
+        self.schedule_shot()
 
         if not self.stats.game_active:
             return
 
-        alien = random.choice(self._find_shooting_aliens())
-        bullet = AlienBullet(self.ai_game, alien)
+        shooters = self._shooting_aliens()
+        if not shooters:
+            return
+        alien = self.shoot_rng.choice(shooters)
+        if self.engine:
+            self.engine.sync_alien(alien)
+        bullet = self.bullet_pool.acquire(alien)
         self.bullets.add(bullet)
 
     def check_bullet_alien_collisions(self, bullets: pygame.sprite.Group):
-        collisions = pygame.sprite.groupcollide(bullets, self.aliens, True, True)
+        collisions = groupcollide(bullets, self.grid, True, True)
         if collisions:
             for _, aliens in collisions.items():
                 for alien in aliens:
+                    self._remove_from_frontline(alien)
                     score = self.settings.alien_points[alien.type]
                     if self.stats.score_bonus:
                         score *= self.settings.bonus_score_scale
 
                     self.stats.score += score
 
-                    if random.randint(1, 100) < self.settings.bonuses_drop_rate * 100:
+                    if self.drop_rng.randint(1, 100) < self.settings.bonuses_drop_rate * 100:
                         self.create_bonus(alien.rect.center)
 
             self.scoreboard.update_score()
 
         if not self.aliens:
-            self.bullets.empty()
-            bullets.empty()
+            kill_all(self.bullets)
+            kill_all(bullets)
             self.ai_game.increase_level()
 
     def _check_bullets_collision(self):
-        pygame.sprite.groupcollide(self.bullets, self.ai_game.ship.bullets, True, True)
+        groupcollide(self.bullets, self.ai_game.ship.bullets, True, True,
+                     self.settings.collision_cell_size)
 
     def create_bonus(self, position, bonus_type: Optional[BonusType] = None):
         if bonus_type is None:
-            bonus_type = BonusesInfo.get_random_bonus()
+            bonus_type = BonusesInfo.get_random_bonus(self.bonus_rng)
 
-        bonus = BonusSprite(self.ai_game, position, bonus_type)
+        bonus = self.bonus_pool.acquire(position, bonus_type)
         self.bonuses.add(bonus)
 
     def _check_fleet_edges(self):
-        for alien in self.aliens.sprites():
-            if alien.check_edges():
-                self._change_fleet_direction()
-                break
+        extents = self._fleet_extents()
+        if not extents:
+            return
+
+        left, right, _ = extents
+        border = self.settings.border_offset_x
+        if left.x <= border or right.x + right.rect.width >= self.screen_rect.right - border:
+            self._change_fleet_direction()
 
     def _check_aliens_bottom(self):
-        screen_rect = self.screen.get_rect()
-        for alien in self.aliens.sprites():
-            if alien.rect.bottom >= screen_rect.bottom:
+        if self.engine:
+            if self.engine.check_bottom():
                 self.ai_game.game_over()
-                break
+            return
+
+        extents = self._fleet_extents()
+        if extents and extents[2].rect.bottom >= self.screen_rect.bottom:
+            self.ai_game.game_over()
 
     def _change_fleet_direction(self):
         for alien in self.aliens.sprites():
             alien.y += self.settings.fleet_drop_speed
         self.settings.fleet_direction *= -1
 
-    def _find_shooting_aliens(self):
-        ships = {}
-        for ship in self.aliens:
-            check = ships.get(ship.num)
-            if check and ship.row > check.row:
-                ships[ship.num] = ship
-            else:
-                ships[ship.num] = ship
-        return tuple(ships.values())
+    def build_frontline(self):
+        # Every column keeps its living aliens ordered by row, the last one is the shooter
+        self._columns = {}
+        for alien in sorted(self.aliens, key=lambda alien: (alien.num, alien.row)):
+            self._columns.setdefault(alien.num, []).append(alien)
+        self.frontline = {num: column[-1] for num, column in self._columns.items()}
+        self._shooters = None
+        self._extents = None
+
+    def _remove_from_frontline(self, alien: Alien):
+        if self.frontline.get(alien.num) is not alien:
+            return
+
+        # Aliens killed behind the frontline are dropped once they reach the end of the column
+        column = self._columns[alien.num]
+        while column and not column[-1].alive():
+            column.pop()
+        if column:
+            self.frontline[alien.num] = column[-1]
+        else:
+            del self.frontline[alien.num]
+            del self._columns[alien.num]
+        self._shooters = None
+        self._extents = None
+
+    def _fleet_extents(self):
+        # The fleet moves as one block, so aliens of a column share x and aliens of a row share y.
+        # The outermost columns and the lowest row only change when a frontline alien dies
+        if self._extents is None and self.frontline:
+            front = self.frontline
+            self._extents = (front[min(front)], front[max(front)],
+                             max(front.values(), key=lambda alien: alien.row))
+        return self._extents
+
+    def _shooting_aliens(self):
+        if self._shooters is None:
+            self._shooters = tuple(self.frontline.values())
+        return self._shooters
 
     def _update_bullets(self):
-        self.bullets.update()
-        self._check_screen_borders(self.bullets)
+        self._check_screen_borders(self.bullets, self.settings.bullet_speed_factor)
 
         self.ai_game.ship.check_ship_bullets_collisions(self.bullets)
 
     def _update_bonuses(self):
-        self.bonuses.update()
-        self._check_screen_borders(self.bonuses)
+        self._check_screen_borders(self.bonuses, self.settings.bonuses_speed)
 
         collisions = pygame.sprite.spritecollide(self.ai_game.ship, self.bonuses, True)
         for bonus in collisions:
             self.stats.enable_bonus(bonus.bonus_type)
 
-    def _check_screen_borders(self, sprite_group: pygame.sprite.Group):
-        for sprite in sprite_group.copy():
+    def _check_screen_borders(self, sprite_group: pygame.sprite.Group, speed):
+        # Moves and culls in one pass, culled sprites go back to their pool
+        for sprite in sprite_group.sprites():
+            sprite.update(speed)
             if sprite.rect.top >= self.settings.screen_height:
-                sprite_group.remove(sprite)
+                sprite.kill()
 
 
 class Alien(Sprite):
+    # Only per-alien state is kept, the tinted image is shared by all aliens of a type
+    # and the fleet passes the movement in update
+    __slots__ = ('row', 'num', 'type', 'image', 'rect', 'x', 'y', 'index')
+
     def __init__(self, alien_fleet: AlienFleet, row=0, num=0):
         super().__init__()
-        self.fleet = alien_fleet
-        self.screen = alien_fleet.screen
-        self.settings = alien_fleet.settings
+        colors = alien_fleet.settings.alien_color
 
         self.row = row
         self.num = num
-        self.type = min(len(self.settings.alien_color) - 1, max(self.row, 0))
-
-        self.image = pygame.image.load("images/alien_bw.png").convert_alpha()
-        color_image = pygame.Surface(self.image.get_size()).convert_alpha()
-        self.color = self.settings.alien_color[self.type]
-        color_image.fill(self.color)
-        self.image.blit(color_image, (0, 0), special_flags=pygame.BLEND_MAX)
+        self.type = min(len(colors) - 1, max(self.row, 0))
+        self.image = surface_cache.get("images/alien_bw.png", tint=colors[self.type])
 
         self.rect = self.image.get_rect()
         self.rect.x = self.rect.width
@@ -201,15 +285,8 @@ class Alien(Sprite):
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
 
-    def check_edges(self):
-        screen_rect = self.screen.get_rect()
-        if self.x + self.rect.width >= \
-                screen_rect.right - self.settings.border_offset_x or self.x <= self.settings.border_offset_x:
-            return True
-        return False
-
-    def update(self) -> None:
-        self.x += self.settings.alien_speed_factor * self.settings.fleet_direction
+    def update(self, dx) -> None:
+        self.x += dx
         self.rect.x = self.lerp(self.rect.x, self.x, 0.05)
         self.rect.y = self.lerp(self.rect.y, self.y, 0.05)
 
@@ -1,6 +1,9 @@
-import time
+import os
 from enum import Enum
-from time import sleep
+from typing import Optional
+from time import sleep, perf_counter
+
+_import_start = perf_counter()
 
 import pygame
 
@@ -9,12 +12,22 @@ from game_stats import GameStats
 from bonuses import BonusType
 from ui import UI
 from game_events import GameEvents
+from image_cache import surface_cache
+from text_cache import text_cache
+from scheduler import Scheduler
+from renderer import DirtyRenderer
+from profiler import FrameProfiler, StartupTimer
+from input_recording import InputRecorder
+from rng import RandomStreams
+from snapshot import save_state, load_state
 
 from star import StarsBackground
 from ship import Ship
 from alien import AlienFleet
 from shelter import ShelterBlocks
 
+_import_time = perf_counter() - _import_start
+
 
 class GameState(Enum):
     PLAY = 0
@@ -24,30 +37,78 @@ class GameState(Enum):
 
 
 class AlienInvasion:
-    def __init__(self):
-        pygame.init()
-        self.settings = Settings()
+    def __init__(self, headless=False, settings: Optional[Settings] = None):
+        self.headless = headless
+        if self.headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+        self.startup = StartupTimer()
+        self.startup.times['imports'] = _import_time
+        self.settings = settings or Settings()
+        if self.settings.fast_start:
+            # The game has no sound or joystick support, events come with the display
+            pygame.display.init()
+            pygame.font.init()
+        else:
+            pygame.init()
+        self.startup.mark('pygame_init')
+
         self.clock = pygame.time.Clock()
+        surface_cache.resize(self.settings.surface_cache_size)
+        text_cache.resize(self.settings.text_cache_size)
+        if self.settings.font_name != text_cache.font_name:
+            text_cache.set_font(self.settings.font_name, self.settings.font_cache_file)
 
-        self.screen = pygame.display.set_mode(
-            (self.settings.screen_width, self.settings.screen_height),
-            pygame.FULLSCREEN if self.settings.fullscreen else 0
-        )
-        if self.settings.fullscreen:
-            self.settings.screen_width = self.screen.get_rect().width
-            self.settings.screen_height = self.screen.get_rect().height
+        self.screen = self._create_display()
 
         pygame.display.set_caption("Alien Invasion")
+        self.startup.mark('display')
         self.game_state = GameState.MENU
+        self.frame = 0
+        self.quick_save: Optional[bytes] = None
+        self.timers = Scheduler()
+        self.rng = RandomStreams(self.settings.game_seed)
+        self.profiler = FrameProfiler(self.settings.profiler_enabled,
+                                      self.settings.profiler_window,
+                                      self.settings.profiler_csv)
 
         self.input = GameEvents(self)
         self.stats = GameStats(self)
+        self.startup.mark('scores')
         self.ui = UI(self)
+        self.startup.mark('ui')
         self.ship = Ship(self)
         self.shelters = ShelterBlocks(self)
 
         self.stars = StarsBackground(self)
+        self.startup.mark('stars')
         self.fleet = AlienFleet(self)
+        self.startup.mark('fleet')
+
+        self.renderer = DirtyRenderer(self) if self.settings.dirty_rendering else None
+
+        if self.settings.record_file:
+            self.input.recorder = InputRecorder(self, self.settings.record_file)
+
+    def _create_display(self):
+        if not self.settings.fullscreen:
+            return pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+
+        if self.settings.render_scaling:
+            # The scene keeps its own resolution, SDL scales it to the display once per frame
+            filters = {'nearest': 'nearest', 'smooth': 'linear'}
+            if self.settings.render_filter not in filters:
+                raise ValueError(f'Unknown render filter: {self.settings.render_filter}')
+            os.environ['SDL_RENDER_SCALE_QUALITY'] = filters[self.settings.render_filter]
+            return pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height),
+                                           pygame.FULLSCREEN | pygame.SCALED)
+
+        screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height),
+                                         pygame.FULLSCREEN)
+        self.settings.screen_width = screen.get_rect().width
+        self.settings.screen_height = screen.get_rect().height
+        return screen
 
     def start_game(self):
         if self.game_state.MENU:
@@ -73,54 +134,121 @@ class AlienInvasion:
     def run_game(self):
         while True:
             self.clock.tick(self.settings.tick_rate)
+            self._check_events()
+            self._update_game()
+            self._update_screen()
+            self._end_frame()
+
+    def step(self, n=1, render_every=0):
+        # Advances n fixed frames without frame pacing, render_every=0 skips rendering
+        for _ in range(n):
+            self._check_events()
+            self._update_game()
+            if render_every and self.frame % render_every == 0:
+                self._update_screen()
+            self._end_frame()
+        return self.game_state
+
+    def save_state(self) -> bytes:
+        return save_state(self)
+
+    def load_state(self, data: bytes, update_ui=True):
+        load_state(self, data, update_ui)
+
+    def _end_frame(self):
+        if self.frame == 1 and 'first_frame' not in self.startup.times:
+            self.startup.mark('first_frame')
+            if self.settings.startup_report:
+                print(self.startup.report())
+        self.profiler.end_frame()
+        if self.input.recorder:
+            self.input.recorder.end_frame()
+        if self.input.playback:
+            self.input.playback.end_frame()
+
+    def _check_events(self):
+        with self.profiler.phase('input'):
             self.input.check_events()
 
-            match self.game_state:
-                case GameState.PLAY:
-                    if self.stats.game_active:
-                        self.stars.stars.update()
+    def _update_game(self):
+        self.frame += 1
+        profiler = self.profiler
+
+        match self.game_state:
+            case GameState.PLAY:
+                if self.stats.game_active:
+                    with profiler.phase('stars'):
+                        self.stars.update()
+                    with profiler.phase('ship'):
                         self.ship.update()
 
+                    with profiler.phase('fleet'):
                         self.fleet.update_aliens()
+                    with profiler.phase('shelters'):
                         self.shelters.update()
-                        self.stats.update_bonuses()
+                    with profiler.phase('timers'):
+                        self.timers.advance(1 / self.settings.tick_rate)
 
-                case GameState.PAUSE:
-                    pass
-
-                case GameState.MENU:
-                    self.stars.stars.update()
+            case GameState.PAUSE:
+                pass
 
-                case GameState.GAMEOVER:
-                    self.stars.stars.update()
+            case GameState.MENU:
+                with profiler.phase('stars'):
+                    self.stars.update()
 
-            self._update_screen()
+            case GameState.GAMEOVER:
+                with profiler.phase('stars'):
+                    self.stars.update()
 
     def _update_screen(self):
+        if self.renderer:
+            self.renderer.update_screen()
+            return
+
+        if self.game_state != GameState.PAUSE:
+            self.draw_background()
+        self.draw_foreground()
+
+        with self.profiler.phase('flip'):
+            pygame.display.flip()
+
+    def draw_background(self):
+        with self.profiler.phase('draw_background'):
+            # The first star layer is baked over the background color and covers the whole screen
+            if not self.stars.opaque:
+                self.screen.fill(self.settings.bg_color)
+            return self.stars.update_screen()
+
+    def draw_foreground(self):
+        profiler = self.profiler
+        rects = []
         match self.game_state:
             case GameState.PLAY:
-                self.screen.fill(self.settings.bg_color)
-                self.stars.update_screen()
-                self.ship.update_screen()
-                self.fleet.update_screen()
-                self.shelters.update_screen()
-                self.ui.show_score()
+                with profiler.phase('draw_ship'):
+                    rects += self.ship.update_screen()
+                with profiler.phase('draw_fleet'):
+                    rects += self.fleet.update_screen()
+                with profiler.phase('draw_shelters'):
+                    rects += self.shelters.update_screen()
+                with profiler.phase('draw_ui'):
+                    rects += self.ui.show_score()
 
             case GameState.PAUSE:
-                self.ui.show_pause()
+                with profiler.phase('draw_ui'):
+                    rects += self.ui.show_pause()
 
             case GameState.MENU:
-                self.screen.fill(self.settings.bg_color)
-                self.stars.update_screen()
-                self.ui.show_menu()
+                with profiler.phase('draw_ui'):
+                    rects += self.ui.show_menu()
 
             case GameState.GAMEOVER:
-                self.screen.fill(self.settings.bg_color)
-                self.stars.update_screen()
-                self.ui.show_score()
-                self.ui.show_gameover()
+                with profiler.phase('draw_ui'):
+                    rects += self.ui.show_score()
+                    rects += self.ui.show_gameover()
 
-        pygame.display.flip()
+        if profiler.overlay:
+            rects += self.ui.show_profiler()
+        return rects
 
     def increase_level(self):
         self.fleet.create_fleet()
@@ -141,12 +269,10 @@ class AlienInvasion:
 
     def pause_game(self):
         if self.game_state == GameState.PLAY:
-            self.pause_time = time.time()
             self.game_state = GameState.PAUSE
             self.stats.game_active = False
 
         elif self.game_state == GameState.PAUSE:
-            self.stats.fix_pause_timers(time.time() - self.pause_time)
             self.game_state = GameState.PLAY
             self.stats.game_active = True
 
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import argparse
+import ast
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from alien_invasion import AlienInvasion, GameState
+from settings import Settings
+
+
+def random_policy(ai: AlienInvasion, rng: random.Random, frame: int):
+    if frame % 20 == 0:
+        direction = rng.choice((-1, 0, 1))
+        ai.ship.moving_left = direction == -1
+        ai.ship.moving_right = direction == 1
+    if rng.random() < .2:
+        ai.ship.fire_bullet()
+
+
+def sweep_policy(ai: AlienInvasion, rng: random.Random, frame: int):
+    if ai.ship.rect.left <= 0:
+        ai.ship.moving_left, ai.ship.moving_right = False, True
+    elif ai.ship.rect.right >= ai.settings.screen_width or not ai.ship.speed:
+        ai.ship.moving_left, ai.ship.moving_right = True, False
+    ai.ship.fire_bullet()
+
+
+POLICIES = {
+    'random': random_policy,
+    'sweep': sweep_policy,
+}
+
+
+def simulate(seed: int, overrides: dict, policy='random', max_frames=60000) -> dict:
+    settings = Settings(scores_file=':memory:', legacy_scores_file=None, game_seed=seed, **overrides)
+    ai = AlienInvasion(headless=True, settings=settings)
+    ai.start_game()
+    policy_rng = ai.rng.stream('policy')
+    act = POLICIES[policy]
+
+    start = time.perf_counter()
+    frames = 0
+    while frames < max_frames and ai.game_state == GameState.PLAY:
+        act(ai, policy_rng, frames)
+        ai.step(1)
+        frames += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        'seed': seed,
+        'overrides': overrides,
+        'survival_time': round(ai.timers.time - ai.stats.start_time, 2),
+        'level': ai.stats.level,
+        'score': round(ai.stats.score),
+        'game_over': ai.game_state == GameState.GAMEOVER,
+        'frames': frames,
+        'frame_ms': round(elapsed / max(frames, 1) * 1000, 4),
+    }
+
+
+def _simulate(job):
+    return simulate(*job)
+
+
+def _summary(values):
+    return {
+        'mean': round(statistics.fmean(values), 2),
+        'p50': round(statistics.median(values), 2),
+        'min': min(values),
+        'max': max(values),
+    }
+
+
+def aggregate(results: list[dict]) -> list[dict]:
+    variants = {}
+    for result in results:
+        variants.setdefault(json.dumps(result['overrides'], sort_keys=True), []).append(result)
+
+    report = []
+    for overrides, runs in variants.items():
+        report.append({
+            'overrides': json.loads(overrides),
+            'games': len(runs),
+            'game_over_rate': round(sum(run['game_over'] for run in runs) / len(runs), 3),
+            **{metric: _summary([run[metric] for run in runs])
+               for metric in ('survival_time', 'level', 'score', 'frame_ms')},
+        })
+    return report
+
+
+def run_batch(variants: list[dict], games: int, policy='random', max_frames=60000,
+              workers=None, seed=0) -> list[dict]:
+    jobs = [(seed + n, overrides, policy, max_frames)
+            for overrides in variants for n in range(games)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_simulate, jobs))
+
+
+def _parse_value(value: str):
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run many headless games in parallel and aggregate the results")
+    parser.add_argument('--games', type=int, default=20, help="games per settings variant")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--policy', choices=POLICIES, default='random')
+    parser.add_argument('--max-frames', type=int, default=60000)
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game, the rest count up")
+    parser.add_argument('--set', action='append', default=[], metavar='NAME=VALUE',
+                        help="settings override applied to every game")
+    parser.add_argument('--sweep', action='append', default=[], metavar='NAME=V1,V2,...',
+                        help="run every combination of these settings values")
+    parser.add_argument('--output', help="write the raw results and report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    base = {}
+    for text in args.set:
+        name, _, value = text.partition('=')
+        base[name] = _parse_value(value)
+    sweeps = []
+    for text in args.sweep:
+        name, _, values = text.partition('=')
+        sweeps.append([(name, _parse_value(value)) for value in values.split(',')])
+    variants = [{**base, **dict(combination)} for combination in itertools.product(*sweeps)]
+
+    start = time.perf_counter()
+    results = run_batch(variants, args.games, args.policy, args.max_frames, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    report = aggregate(results)
+
+    for variant in report:
+        print(f"{variant['overrides'] or 'defaults'}: {variant['games']} games, "
+              f"level {variant['level']['mean']}, score {variant['score']['mean']}, "
+              f"survival {variant['survival_time']['mean']} s, {variant['frame_ms']['mean']} ms/frame")
+    print(f"{len(results)} games in {elapsed:.1f} s on {args.workers} workers", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'report': report, 'results': results}, f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
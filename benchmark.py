@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from alien_invasion import AlienInvasion, GameState
+from bonuses import BonusType
+from score_store import ScoreInfo
+from settings import Settings
+
+
+@dataclass
+class Scenario:
+    name: str
+    settings: dict = field(default_factory=dict)
+    setup: Callable[[AlienInvasion], None] = lambda ai: None
+    frame: Callable[[AlienInvasion, int], None] = lambda ai, n: None
+    play: bool = True
+
+
+def _keep_shooting(ai: AlienInvasion, n):
+    ai.ship.moving_right = n // 200 % 2 == 0
+    ai.ship.moving_left = not ai.ship.moving_right
+    ai.ship.fire_bullet()
+
+
+def _unlimited_ammo(ai: AlienInvasion):
+    ai.stats.enable_bonus(BonusType.AMMO)
+    ai.timers.cancel(('bonus', BonusType.AMMO))
+
+
+def _high_level(ai: AlienInvasion):
+    for _ in range(50):
+        ai.settings.increase_speed()
+    ai.stats.level += 50
+    ai.ui.update_level()
+
+
+def _large_leaderboard(ai: AlienInvasion):
+    rng = random.Random(0)
+    for _ in range(20000):
+        ai.stats.scores.add(ScoreInfo(rng.randint(0, 50000), rng.randint(1, 20),
+                                      rng.uniform(10, 600), f"Player{rng.randint(0, 999)}"))
+    ai.stats.leaderboard.reload()
+    ai.ui.update_highscore()
+
+
+def _finish_games(ai: AlienInvasion, n):
+    # Simulates returning to the menu after a game every half second
+    if n % 50 == 0:
+        ai.stats.score = ai.rng.stream('benchmark').randint(0, 50000)
+        ai.stats.add_score("Bench")
+
+
+SCENARIOS = {
+    scenario.name: scenario for scenario in (
+        Scenario('default', frame=_keep_shooting),
+        Scenario('dense_fleet', {'screen_width': 2560, 'screen_height': 1440,
+                                 'number_aliens_x': 30, 'number_aliens_y': 10}, frame=_keep_shooting),
+        Scenario('bullet_storm', {'alien_shoot_timer': 20}, setup=_unlimited_ammo, frame=_keep_shooting),
+        Scenario('many_shelters', {'shelter_count': 8, 'shelter_width': 21, 'shelter_height': 8,
+                                   'shelter_brick_size': 4}, frame=_keep_shooting),
+        Scenario('level_50', setup=_high_level, frame=_keep_shooting),
+        Scenario('menu_leaderboard', setup=_large_leaderboard, frame=_finish_games, play=False),
+    )
+}
+
+
+def _start(ai: AlienInvasion, scenario: Scenario):
+    if scenario.play:
+        ai.game_state = GameState.MENU
+        ai.start_game()
+        ai.stats.shield = True
+    scenario.setup(ai)
+
+
+def run_scenario(scenario: Scenario, frames=1000, warmup=100, seed=0) -> dict:
+    settings = Settings(scores_file=':memory:', legacy_scores_file=None, game_seed=seed,
+                        profiler_enabled=True, profiler_window=frames, **scenario.settings)
+    ai = AlienInvasion(headless=True, settings=settings)
+    _start(ai, scenario)
+
+    restarts = 0
+    elapsed = 0.0
+    for n in range(warmup + frames):
+        if n == warmup:
+            ai.profiler.reset()
+
+        start = time.perf_counter()
+        scenario.frame(ai, n)
+        ai.step(1, render_every=1)
+        if n >= warmup:
+            elapsed += time.perf_counter() - start
+
+        if scenario.play and ai.game_state != GameState.PLAY:
+            restarts += 1
+            _start(ai, scenario)
+
+    phases = {}
+    for name, (p50, p95, p99) in ai.profiler.percentiles().items():
+        samples = ai.profiler.samples[name]
+        phases[name] = {
+            'mean': round(sum(samples) / len(samples) * 1000, 4),
+            'p50': round(p50, 4), 'p95': round(p95, 4), 'p99': round(p99, 4),
+        }
+
+    return {
+        'frames': frames,
+        'fps': round(frames / elapsed, 2),
+        'restarts': restarts,
+        'startup_ms': {name: round(seconds * 1000, 2) for name, seconds in ai.startup.times.items()},
+        'phases': phases,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    failures = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]['fps']
+        if result['fps'] < expected * (1 - threshold):
+            failures.append(f"{name}: {result['fps']:.1f} fps, baseline {expected:.1f} fps "
+                            f"({result['fps'] / expected - 1:+.1%})")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Alien Invasion benchmarks")
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                        help=f"scenarios to run, all by default: {', '.join(SCENARIOS)}")
+    parser.add_argument('--frames', type=int, default=1000)
+    parser.add_argument('--warmup', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write results JSON to this file")
+    parser.add_argument('--baseline', help="fail when a scenario is slower than in this results file")
+    parser.add_argument('--threshold', type=float, default=.15,
+                        help="allowed fps drop against the baseline, .15 = 15%%")
+    args = parser.parse_args(argv)
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario: {name}")
+
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        results[name] = run_scenario(SCENARIOS[name], args.frames, args.warmup, args.seed)
+        print(f"{name:<18} {results[name]['fps']:>9.1f} fps", file=sys.stderr)
+
+    output = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(results, json.load(f), args.threshold)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,8 +5,8 @@ from typing import TYPE_CHECKING
 from enum import Enum
 from dataclasses import dataclass
 
-import pygame
-from pygame.sprite import Sprite
+from image_cache import surface_cache
+from pool import PooledSprite
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
@@ -49,39 +49,41 @@ class BonusesInfo:
     }
 
     @classmethod
-    def get_random_bonus(cls):
+    def get_random_bonus(cls, rng: random.Random = random):
         items = filter(lambda x: x[1].available, cls.BONUSES.items())
         bonuses_types, bonus_items = zip(*items)
         weights = tuple(x.weight for x in bonus_items)
-        bonus = random.choices(bonuses_types, weights=weights, k=1)[0]
+        bonus = rng.choices(bonuses_types, weights=weights, k=1)[0]
         return bonus
 
 
-class BonusSprite(Sprite):
+class BonusSprite(PooledSprite):
     def __init__(self, ai_game: AlienInvasion, position, bonus_type: BonusType):
         super().__init__()
         self.screen = ai_game.screen
         self.settings = ai_game.settings
-        self.bonus_type = bonus_type
-        self.bonus_info = BonusesInfo.BONUSES[self.bonus_type]
 
         self.color = (255, 255, 255)
         self.size = self.settings.bonuses_size
 
-        self.image = pygame.image.load(self.bonus_info.sprite).convert_alpha()
-        color_image = pygame.Surface(self.image.get_size()).convert_alpha()
-        color_image.fill(self.color)
-        self.image.blit(color_image, (0, 0), special_flags=pygame.BLEND_MAX)
-        scale = self.image.get_size()[0] / self.image.get_size()[1]
-        self.image = pygame.transform.scale(self.image, (self.size * scale, self.size))
+        self.reset(position, bonus_type)
+
+    def reset(self, position, bonus_type: BonusType):
+        self.bonus_type = bonus_type
+        self.bonus_info = BonusesInfo.BONUSES[self.bonus_type]
+
+        image = surface_cache.get(self.bonus_info.sprite, tint=self.color)
+        scale = image.get_size()[0] / image.get_size()[1]
+        self.image = surface_cache.get(self.bonus_info.sprite, tint=self.color,
+                                       scale=(self.size * scale, self.size))
 
         self.rect = self.image.get_rect()
         self.rect.center = position
         self.y = float(self.rect.y)
 
-    def update(self):
-        self.y += self.settings.bonuses_speed * 1
+    def update(self, speed):
+        self.y += speed
         self.rect.y = self.y
 
     def update_screen(self):
-        self.screen.blit(self.image, self.rect)
+        return self.screen.blit(self.image, self.rect)
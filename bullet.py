@@ -1,45 +1,52 @@
 from __future__ import annotations
 
 import pygame
-from pygame.sprite import Sprite
 from typing import TYPE_CHECKING
 
+from image_cache import surface_cache
+from pool import PooledSprite
+
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
 
 
-class Bullet(Sprite):
+class Bullet(PooledSprite):
+    # Only per-bullet state is kept, the color lives in the shared image and the owner passes the speed
+    __slots__ = ('image', 'rect', 'y')
+    direction = -1
+
     def __init__(self, ai_game: AlienInvasion, ship):
         super().__init__()
-        self.screen = ai_game.screen
-        self.settings = ai_game.settings
-        self.color = self.settings.bullet_color
-        self.rect = self._create_rect(ship)
+        self.rect = self._create_rect(ai_game.settings)
+        self.image = surface_cache.solid(self.rect.size, self._create_color(ai_game.settings))
 
-        self.y = float(self.rect.y)
-        self.direction = -1
+        self.reset(ship)
 
-    def _create_rect(self, ship):
-        rect = pygame.Rect(0, 0, self.settings.bullet_width, self.settings.bullet_height)
-        rect.midtop = ship.rect.midtop
-        return rect
+    def _create_color(self, settings):
+        return settings.bullet_color
 
-    def update(self):
-        self.y += self.settings.bullet_speed_factor * self.direction
-        self.rect.y = self.y
+    def _create_rect(self, settings):
+        return pygame.Rect(0, 0, settings.bullet_width, settings.bullet_height)
+
+    def reset(self, ship):
+        self.rect.midtop = ship.rect.midtop
+        self.y = float(self.rect.y)
 
-    def draw_bullet(self):
-        pygame.draw.rect(self.screen, self.color, self.rect)
+    def update(self, speed):
+        self.y += speed * self.direction
+        self.rect.y = self.y
 
 
 class AlienBullet(Bullet):
-    def __init__(self, ai_game: AlienInvasion, ship):
-        super().__init__(ai_game, ship)
-        self.color = self.settings.alien_bullet_color
-        self.direction = 1
-
-    def _create_rect(self, ship):
-        rect = pygame.Rect(0, 0, self.settings.alien_bullet_width,
-                                self.settings.alien_bullet_height)
-        rect.midbottom = ship.rect.midbottom
-        return rect
+    __slots__ = ()
+    direction = 1
+
+    def _create_color(self, settings):
+        return settings.alien_bullet_color
+
+    def _create_rect(self, settings):
+        return pygame.Rect(0, 0, settings.alien_bullet_width, settings.alien_bullet_height)
+
+    def reset(self, ship):
+        self.rect.midbottom = ship.rect.midbottom
+        self.y = float(self.rect.y)
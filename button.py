@@ -2,6 +2,8 @@ from __future__ import annotations
 import pygame.font
 from typing import TYPE_CHECKING
 
+from text_cache import text_cache
+
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
 
@@ -14,7 +16,7 @@ class Button:
         self.width, self.height = 350, 50
         self.button_color = aigame.settings.bg_color
         self.text_color = (255, 255, 255)
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = text_cache.font(48)
 
         self.rect = pygame.Rect(0, 0, self.width, self.height)
         self.rect.midbottom = (self.screen_rect.midbottom[0],
@@ -28,5 +30,5 @@ class Button:
         self.msg_image_rect.center = self.rect.center
 
     def draw_button(self):
-        self.screen.fill(self.button_color, self.rect)
-        self.screen.blit(self.msg_image, self.msg_image_rect)
+        return [self.screen.fill(self.button_color, self.rect),
+                self.screen.blit(self.msg_image, self.msg_image_rect)]
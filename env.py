@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import pygame
+
+from alien_invasion import AlienInvasion, GameState
+from settings import Settings
+
+
+class AlienInvasionEnv:
+    # noop, left, right, fire, left + fire, right + fire
+    ACTIONS = (
+        (False, False, False),
+        (True, False, False),
+        (False, True, False),
+        (False, False, True),
+        (True, False, True),
+        (False, True, True),
+    )
+    n_actions = len(ACTIONS)
+
+    def __init__(self, observation='state', frame_skip=4, max_steps=10000,
+                 max_bullets=16, max_alien_bullets=16, max_bonuses=4, copy_pixels=True, **settings):
+        if np is None:
+            raise RuntimeError('AlienInvasionEnv requires numpy to be installed')
+        if observation not in ('state', 'pixels'):
+            raise ValueError(f'Unknown observation type: {observation}')
+
+        self.observation = observation
+        self.copy_pixels = copy_pixels
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.max_bullets = max_bullets
+        self.max_alien_bullets = max_alien_bullets
+        self.max_bonuses = max_bonuses
+
+        settings.setdefault('scores_file', ':memory:')
+        settings.setdefault('legacy_scores_file', None)
+        self.ai = AlienInvasion(headless=True, settings=Settings(**settings))
+        self.settings = self.ai.settings
+
+        self.max_aliens = self.settings.number_aliens_x * self.settings.number_aliens_y
+        self._state = np.zeros(
+            5
+            + 3 * self.max_aliens
+            + 2 * self.max_bullets
+            + 2 * self.max_alien_bullets
+            + 3 * self.max_bonuses
+            + self.settings.shelter_count,
+            dtype=np.float32
+        )
+        self.steps = 0
+
+    @property
+    def observation_shape(self):
+        if self.observation == 'pixels':
+            return self.settings.screen_width, self.settings.screen_height, 3
+        return self._state.shape
+
+    def reset(self, seed: Optional[int] = None):
+        self._check_screen_released()
+        ai = self.ai
+        if seed is not None:
+            ai.rng.reseed(seed)
+        # Game time and the background restart too, so the same seed replays the same episode
+        ai.frame = 0
+        ai.timers.reset()
+        ai.stars.reset()
+        ai.game_state = GameState.MENU
+        ai.start_game()
+        ai.fleet.schedule_shot()
+        self.steps = 0
+        return self._observe(), self._info()
+
+    def step(self, action: int):
+        self._check_screen_released()
+        ai = self.ai
+        left, right, fire = self.ACTIONS[action]
+        ai.ship.moving_left = left
+        ai.ship.moving_right = right
+        if fire:
+            ai.ship.fire_bullet()
+
+        score = ai.stats.score
+        ai.step(self.frame_skip)
+        self.steps += 1
+
+        reward = ai.stats.score - score
+        terminated = ai.game_state != GameState.PLAY
+        truncated = not terminated and self.steps >= self.max_steps
+        return self._observe(), reward, terminated, truncated, self._info()
+
+    def _info(self):
+        return {'score': self.ai.stats.score, 'level': self.ai.stats.level,
+                'lives': self.ai.stats.ships_lives, 'frame': self.ai.frame}
+
+    def _observe(self):
+        if self.observation == 'pixels':
+            return self.pixels()
+        return self._state_observation()
+
+    def _check_screen_released(self):
+        # Every env renders to the shared display, a live pixels3d view keeps it locked
+        if self.observation == 'pixels' and self.ai.screen.get_locked():
+            raise RuntimeError('A pixel observation view still references the screen, delete or copy it '
+                               'before the next reset/step, or create the env with copy_pixels=True')
+
+    def pixels(self):
+        screen = self.ai.screen
+        self._check_screen_released()
+        self.ai._update_screen()
+        if self.copy_pixels:
+            return pygame.surfarray.array3d(screen)
+        return pygame.surfarray.pixels3d(screen)
+
+    def _state_observation(self):
+        ai = self.ai
+        width, height = self.settings.screen_width, self.settings.screen_height
+        obs = self._state
+        obs.fill(0)
+
+        obs[0] = ai.ship.rect.centerx / width
+        obs[1] = ai.stats.ships_lives / self.settings.ships_lives_bonus_max
+        obs[2] = ai.stats.shield
+        obs[3] = ai.stats.unlimited_ammo
+        obs[4] = ai.stats.score_bonus
+        offset = 5
+
+        aliens = obs[offset:offset + 3 * self.max_aliens].reshape(self.max_aliens, 3)
+        ai.fleet.sync_positions()
+        for alien in ai.fleet.aliens:
+            index = alien.row * self.settings.number_aliens_x + alien.num - 1
+            if index < self.max_aliens:
+                aliens[index] = 1, alien.rect.centerx / width, alien.rect.centery / height
+        offset += 3 * self.max_aliens
+
+        for group, size in ((ai.ship.bullets, self.max_bullets), (ai.fleet.bullets, self.max_alien_bullets)):
+            bullets = obs[offset:offset + 2 * size].reshape(size, 2)
+            for n, bullet in zip(range(size), group):
+                bullets[n] = bullet.rect.centerx / width, bullet.rect.centery / height
+            offset += 2 * size
+
+        bonuses = obs[offset:offset + 3 * self.max_bonuses].reshape(self.max_bonuses, 3)
+        for n, bonus in zip(range(self.max_bonuses), ai.fleet.bonuses):
+            bonuses[n] = bonus.bonus_type.value + 1, bonus.rect.centerx / width, bonus.rect.centery / height
+        offset += 3 * self.max_bonuses
+
+        bricks = self.settings.shelter_width * self.settings.shelter_height
+        for n, shelter in zip(range(self.settings.shelter_count), ai.shelters.shelters):
+            obs[offset + n] = len(shelter.bricks) / bricks
+        return obs
+
+
+class VectorEnv:
+    # A synchronous convenience wrapper, the envs step one after another in this process.
+    # For throughput run independent envs in worker processes, as batch.py does
+    def __init__(self, num_envs: int, **env_kwargs):
+        # Observations are copied into the batch buffers, so the envs can hand out views
+        env_kwargs.setdefault('copy_pixels', False)
+        self.envs = [AlienInvasionEnv(**env_kwargs) for _ in range(num_envs)]
+        self.num_envs = num_envs
+        self.observations = np.zeros((num_envs, *self.envs[0].observation_shape),
+                                     dtype=np.uint8 if self.envs[0].observation == 'pixels' else np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+
+    def reset(self, seed: Optional[int] = None):
+        infos = []
+        for n, env in enumerate(self.envs):
+            obs, info = env.reset(None if seed is None else seed + n)
+            np.copyto(self.observations[n], obs)
+            del obs
+            infos.append(info)
+        return self.observations, infos
+
+    def step(self, actions):
+        # All instances share the pygame display, so pixel observations are copied out right after rendering
+        infos = []
+        for n, (env, action) in enumerate(zip(self.envs, actions)):
+            obs, self.rewards[n], self.terminated[n], self.truncated[n], info = env.step(int(action))
+            if self.terminated[n] or self.truncated[n]:
+                info['final_info'] = dict(info)
+                del obs
+                obs, _ = env.reset()
+            np.copyto(self.observations[n], obs)
+            del obs
+            infos.append(info)
+        return self.observations, self.rewards, self.terminated, self.truncated, infos
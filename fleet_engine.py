@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from alien import AlienFleet
+
+
+class NumpyFleetEngine:
+    # Replaces the fleet spatial hash: positions live in the arrays and are written back to
+    # the sprites only for aliens that are hit and before the fleet is drawn or inspected
+    def __init__(self, fleet: AlienFleet):
+        if np is None:
+            raise RuntimeError('fleet_backend "numpy" requires numpy to be installed')
+
+        self.fleet = fleet
+        self.settings = fleet.settings
+        self.screen_rect = fleet.screen.get_rect()
+        self.build()
+
+    def build(self):
+        self.aliens = self.fleet.aliens.sprites()
+        for index, alien in enumerate(self.aliens):
+            alien.index = index
+
+        self.x = np.array([alien.x for alien in self.aliens], dtype=float)
+        self.y = np.array([alien.y for alien in self.aliens], dtype=float)
+        self.rect_x = np.array([alien.rect.x for alien in self.aliens], dtype=float)
+        self.rect_y = np.array([alien.rect.y for alien in self.aliens], dtype=float)
+        self.types = np.array([alien.type for alien in self.aliens], dtype=np.int8)
+        self.alive = np.ones(len(self.aliens), dtype=bool)
+        self.alive_count = len(self.aliens)
+        self.width = self.aliens[0].rect.width if self.aliens else 0
+        self.height = self.aliens[0].rect.height if self.aliens else 0
+        self._stale = False
+
+    def rebuild(self, sprites=None):
+        self.build()
+
+    def clear(self):
+        self.build()
+
+    def remove(self, alien):
+        if self.alive[alien.index]:
+            self.alive[alien.index] = False
+            self.alive_count -= 1
+
+    def collide(self, rect):
+        # Same result and order as SpatialHash.collide, the hit aliens get their positions written back
+        self._sync_alive()
+        if not self.alive_count or not rect.width or not rect.height:
+            return []
+        hits = (self.alive
+                & (self.rect_x < rect.right) & (self.rect_x + self.width > rect.left)
+                & (self.rect_y < rect.bottom) & (self.rect_y + self.height > rect.top)).nonzero()[0]
+        aliens = []
+        for index in hits.tolist():
+            alien = self.aliens[index]
+            self.sync_alien(alien)
+            aliens.append(alien)
+        return aliens
+
+    def sync_alien(self, alien):
+        index = alien.index
+        alien.x, alien.y = float(self.x[index]), float(self.y[index])
+        alien.rect.topleft = float(self.rect_x[index]), float(self.rect_y[index])
+
+    def write_back(self):
+        if not self._stale:
+            return
+        self._stale = False
+        alive = self.alive.nonzero()[0]
+        for alien, x, y, rect_x, rect_y in zip(
+                (self.aliens[i] for i in alive), self.x[alive].tolist(), self.y[alive].tolist(),
+                self.rect_x[alive].tolist(), self.rect_y[alive].tolist()):
+            alien.x, alien.y = x, y
+            alien.rect.topleft = rect_x, rect_y
+
+    def _sync_alive(self):
+        # Kills through remove() keep the count in step, the mask is refreshed only when the group shrank otherwise
+        if len(self.fleet.aliens) == self.alive_count:
+            return
+        self.alive[:] = False
+        self.alive[[alien.index for alien in self.fleet.aliens]] = True
+        self.alive_count = len(self.fleet.aliens)
+
+    def update(self):
+        self._sync_alive()
+        if not self.alive_count:
+            return
+
+        if self.check_edges():
+            self.y += self.settings.fleet_drop_speed
+            self.settings.fleet_direction *= -1
+
+        self.x += self.settings.alien_speed_factor * self.settings.fleet_direction
+        self.rect_x = self._round(self.rect_x + (self.x - self.rect_x) * 0.05)
+        self.rect_y = self._round(self.rect_y + (self.y - self.rect_y) * 0.05)
+        self._stale = True
+
+    def check_edges(self):
+        x = self.x[self.alive]
+        return bool(x.max() + self.width >= self.screen_rect.right - self.settings.border_offset_x
+                    or x.min() <= self.settings.border_offset_x)
+
+    def check_bottom(self):
+        self._sync_alive()
+        if not self.alive_count:
+            return False
+        return bool(self.rect_y[self.alive].max() + self.height >= self.screen_rect.bottom)
+
+    @staticmethod
+    def _round(values):
+        # Same rounding as assigning a float to pygame.Rect
+        return np.copysign(np.floor(np.abs(values) + 0.5), values)
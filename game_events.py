@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import pygame
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
+    from input_recording import InputRecorder, InputPlayback
 
 
 class GameEvents:
     def __init__(self, ai_game: AlienInvasion):
         self.ai = ai_game
+        self.recorder: Optional[InputRecorder] = None
+        self.playback: Optional[InputPlayback] = None
 
     def check_events(self):
-        events = pygame.event.get()
+        if self.playback:
+            events = self.playback.next_events()
+        else:
+            events = pygame.event.get()
+        if self.recorder:
+            self.recorder.record(events)
 
         for event in events:
             match event.type:
@@ -25,10 +33,7 @@ class GameEvents:
                 case pygame.KEYUP:
                     self._check_keyup_events(event)
                 case pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = pygame.mouse.get_pos()
-                    self.ai.ui.check_play_button(mouse_pos)
-                case self.ai.settings.alien_shoot_event:
-                    self.ai.fleet.fire_random_bullet()
+                    self.ai.ui.check_play_button(event.pos)
 
         if self.ai.game_state == self.ai.game_state.GAMEOVER:
             self.ai.ui.name_input.update(events)
@@ -45,6 +50,11 @@ class GameEvents:
                         self.ai.ship.fire_bullet()
                     case pygame.K_ESCAPE:
                         self.ai.pause_game()
+                    case pygame.K_F5:
+                        self.ai.quick_save = self.ai.save_state()
+                    case pygame.K_F9:
+                        if self.ai.quick_save:
+                            self.ai.load_state(self.ai.quick_save)
 
             case self.ai.game_state.MENU:
                 match event.key:
@@ -61,6 +71,10 @@ class GameEvents:
             case pygame.K_q:
                 if self.ai.game_state != self.ai.game_state.GAMEOVER:
                     sys.exit(0)
+            case pygame.K_F3:
+                self.ai.profiler.toggle_overlay()
+                if self.ai.renderer:
+                    self.ai.renderer.invalidate()
 
     def _check_keyup_events(self, event):
         if event.key == pygame.K_RIGHT:
@@ -1,32 +1,25 @@
 from __future__ import annotations
 
-import json
-import time
-from collections import namedtuple
-
 from typing import TYPE_CHECKING
 from bonuses import BonusType, BonusesInfo
+from score_store import ScoreInfo, create_score_store
+from leaderboard import Leaderboard
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
 
-ScoreInfo = namedtuple('ScoreInfo', [
-    'score',
-    'level',
-    'time',
-    'name'
-])
-
 
 class GameStats:
     def __init__(self, ai_game: AlienInvasion):
         self.ai_game = ai_game
         self.settings = ai_game.settings
+        self.timers = ai_game.timers
         self.game_active = False
         self.high_score = 0
         self.level = 1
 
-        self.score_history: list[ScoreInfo] = []
+        self.scores = create_score_store(self.settings)
+        self.leaderboard = Leaderboard(self.scores, self.settings.leaderboard_size)
         self.load_score_history()
 
         self.bonuses = {}
@@ -40,25 +33,24 @@ class GameStats:
         self.ships_lives = self.settings.ships_lives
         self.score = 0
         self.level = 1
-        self.start_time = time.time()
-        self.pause_time = 0.0
+        self.start_time = self.timers.time
 
+        for bonus in self.bonuses:
+            self.timers.cancel(('bonus', bonus))
         self.bonuses.clear()
         self.shield = False
         self.unlimited_ammo = False
+        self.score_bonus = False
+        if hasattr(self.ai_game, 'ship'):
+            self.ai_game.ship.image.set_alpha(255)
         if hasattr(self.ai_game, 'ui'):
             self.ai_game.ui.update_bonuses()
 
-    def fix_pause_timers(self, seconds):
-        self.pause_time += seconds
-        for bonus in self.bonuses:
-            self.bonuses[bonus] += seconds
-
     def enable_bonus(self, bonus: BonusType):
         if bonus in (BonusType.GOD, BonusType.SHIELD):
             self.ai_game.stats.shield = True
             self.ai_game.ship.image.set_alpha(128)
-            self.bonuses[BonusType.SHIELD] = time.time() + BonusesInfo.BONUSES[bonus].timer
+            self._start_bonus_timer(BonusType.SHIELD, BonusesInfo.BONUSES[bonus].timer)
 
         elif bonus == BonusType.HEALTH:
             if self.ai_game.stats.ships_lives < self.settings.ships_lives_bonus_max:
@@ -67,14 +59,31 @@ class GameStats:
 
         elif bonus == BonusType.AMMO:
             self.ai_game.stats.unlimited_ammo = True
-            self.bonuses[bonus] = time.time() + BonusesInfo.BONUSES[bonus].timer
+            self._start_bonus_timer(bonus, BonusesInfo.BONUSES[bonus].timer)
 
         elif bonus == BonusType.SCORE:
             self.score_bonus = True
-            self.bonuses[bonus] = time.time() + BonusesInfo.BONUSES[bonus].timer
+            self._start_bonus_timer(bonus, BonusesInfo.BONUSES[bonus].timer)
 
         self.ai_game.ui.update_bonuses()
 
+    def _start_bonus_timer(self, bonus: BonusType, seconds: float):
+        self.bonuses[bonus] = self.timers.time + seconds
+        self.timers.schedule(seconds, lambda: self.disable_bonus(bonus), key=('bonus', bonus))
+
+    def restore_bonuses(self, bonuses: dict[BonusType, float]):
+        # Bonuses map to the game time they end at, timers are rescheduled for the time left
+        for bonus in self.bonuses:
+            self.timers.cancel(('bonus', bonus))
+        self.bonuses.clear()
+        for bonus, end in bonuses.items():
+            self._start_bonus_timer(bonus, end - self.timers.time)
+
+        self.shield = BonusType.SHIELD in self.bonuses
+        self.unlimited_ammo = BonusType.AMMO in self.bonuses
+        self.score_bonus = BonusType.SCORE in self.bonuses
+        self.ai_game.ship.image.set_alpha(128 if self.shield else 255)
+
     def disable_bonus(self, bonus: BonusType):
         if bonus not in self.bonuses:
             return
@@ -88,38 +97,21 @@ class GameStats:
             self.score_bonus = False
 
         del self.bonuses[bonus]
+        self.timers.cancel(('bonus', bonus))
         self.ai_game.ui.update_bonuses()
 
-    def update_bonuses(self):
-        t = time.time()
-        for bonus, end_time in tuple(self.bonuses.items()):
-            if t > end_time:
-                self.disable_bonus(bonus)
-
     def load_score_history(self):
-        try:
-            with open("scores.json", "r") as f:
-                self.score_history = [ScoreInfo(*x) for x in json.load(f)]
-                if self.score_history:
-                    self.high_score = max(self.score_history,
-                                          key=lambda x: x.score)[0]
-        except FileNotFoundError:
-            pass
-
-    def save_score_history(self):
-        with open("scores.json", "w") as f:
-            json.dump(self.score_history, f, indent=4)
+        self.high_score = self.leaderboard.high_score
 
     def add_score(self, name: str):
-        total_time = time.time() - (self.start_time + self.pause_time)
+        total_time = self.timers.time - self.start_time
 
-        self.score_history.append(ScoreInfo(
+        self.leaderboard.add(ScoreInfo(
             self.score,
             self.level,
             round(total_time, 2),
             name
         ))
-        self.save_score_history()
 
         self.check_high_score()
         self.ai_game.ui.update_highscore()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional
+
+import pygame
+
+
+class SurfaceCache:
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def get(self, path: str, tint: Optional[tuple] = None, scale: Optional[tuple] = None,
+            rotation: int = 0, alpha: Optional[int] = None) -> pygame.Surface:
+        # Returned surfaces are shared, copy them before drawing on them or changing alpha
+        if scale is not None:
+            scale = (round(scale[0]), round(scale[1]))
+        key = (path, tint, scale, rotation, alpha)
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._build(path, tint, scale, rotation, alpha)
+        self._surfaces[key] = surface
+        while len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def solid(self, size: tuple, color: tuple) -> pygame.Surface:
+        # Pre-filled surface, so plain rectangles can be batched with image blits
+        key = ('solid', tuple(size), tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = pygame.Surface(size).convert()
+        surface.fill(color)
+        while len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def _build(self, path, tint, scale, rotation, alpha):
+        if alpha is not None:
+            image = self.get(path, tint, scale, rotation).copy()
+            image.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        elif rotation:
+            image = pygame.transform.rotate(self.get(path, tint, scale), rotation)
+        elif scale is not None:
+            image = pygame.transform.scale(self.get(path, tint), scale)
+        elif tint is not None:
+            image = self.get(path).copy()
+            color_image = pygame.Surface(image.get_size()).convert_alpha()
+            color_image.fill(tint)
+            image.blit(color_image, (0, 0), special_flags=pygame.BLEND_MAX)
+        else:
+            image = pygame.image.load(path).convert_alpha()
+        return image
+
+    def resize(self, max_size):
+        self.max_size = max_size
+        while len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+surface_cache = SurfaceCache()
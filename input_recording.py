@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import atexit
+import json
+import zlib
+from typing import TYPE_CHECKING
+
+import pygame
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+RECORDED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN)
+EVENT_ATTRIBUTES = ('key', 'mod', 'unicode', 'scancode', 'pos', 'button')
+
+
+class ReplayDesync(Exception):
+    def __init__(self, frame, expected, actual):
+        super().__init__(f'State hash mismatch at frame {frame}: expected {expected}, got {actual}')
+        self.frame = frame
+        self.expected = expected
+        self.actual = actual
+
+
+def state_hash(ai_game: AlienInvasion) -> int:
+    stats = ai_game.stats
+    fleet = ai_game.fleet
+    fleet.sync_positions()
+    state = (
+        ai_game.frame,
+        ai_game.game_state.value,
+        stats.score,
+        stats.level,
+        stats.ships_lives,
+        sorted((bonus.value, end_time) for bonus, end_time in stats.bonuses.items()),
+        ai_game.ship.x,
+        [alien.rect.topleft for alien in fleet.aliens],
+        [bullet.rect.topleft for bullet in fleet.bullets],
+        [bullet.rect.topleft for bullet in ai_game.ship.bullets],
+        [(bonus.bonus_type.value, bonus.rect.topleft) for bonus in fleet.bonuses],
+        [len(shelter.bricks) for shelter in ai_game.shelters.shelters],
+    )
+    return zlib.crc32(repr(state).encode())
+
+
+def _to_tuples(value):
+    # JSON turns tuples into lists, settings such as colors are used as cache keys
+    if isinstance(value, list):
+        return tuple(_to_tuples(item) for item in value)
+    return value
+
+
+def _serialize_event(event: pygame.event.Event):
+    data = {name: event.dict[name] for name in EVENT_ATTRIBUTES if name in event.dict}
+    return [event.type, data]
+
+
+def _deserialize_event(data):
+    event_type, attributes = data
+    return pygame.event.Event(event_type, {name: _to_tuples(value) for name, value in attributes.items()})
+
+
+class InputRecorder:
+    def __init__(self, ai_game: AlienInvasion, path: str):
+        self.ai_game = ai_game
+        self.path = path
+        self.seed = ai_game.rng.seed
+        self.settings = {
+            **ai_game.settings.overrides,
+            'screen_width': ai_game.settings.screen_width,
+            'screen_height': ai_game.settings.screen_height,
+        }
+        self.frames: list[list] = []
+        self.hashes: list[int] = []
+        self._events: list = []
+
+        atexit.register(self.save)
+
+    def record(self, events: list[pygame.event.Event]):
+        self._events = [_serialize_event(event) for event in events if event.type in RECORDED_EVENTS]
+
+    def end_frame(self):
+        self.frames.append(self._events)
+        self.hashes.append(state_hash(self.ai_game))
+        self._events = []
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            json.dump({
+                'version': 1,
+                'seed': self.seed,
+                'settings': self.settings,
+                'frames': self.frames,
+                'hashes': self.hashes,
+            }, f)
+
+
+class InputPlayback:
+    def __init__(self, ai_game: AlienInvasion, recording: dict):
+        self.ai_game = ai_game
+        self.frames = recording['frames']
+        self.hashes = recording['hashes']
+        self.frame = 0
+
+    @property
+    def finished(self):
+        return self.frame >= len(self.frames)
+
+    def next_events(self) -> list[pygame.event.Event]:
+        # Real events are drained so the dummy video driver queue never fills up
+        pygame.event.pump()
+        pygame.event.clear()
+        return [_deserialize_event(event) for event in self.frames[self.frame]]
+
+    def end_frame(self):
+        actual = state_hash(self.ai_game)
+        expected = self.hashes[self.frame]
+        self.frame += 1
+        if actual != expected:
+            raise ReplayDesync(self.frame - 1, expected, actual)
+
+
+def load_recording(path: str) -> dict:
+    with open(path) as f:
+        recording = json.load(f)
+    recording['settings'] = {name: _to_tuples(value) for name, value in recording['settings'].items()}
+    return recording
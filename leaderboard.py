@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import bisect
+from typing import Optional
+
+from score_store import ScoreInfo, rank_key
+
+
+class Leaderboard:
+    def __init__(self, store, size=10):
+        self.store = store
+        self.size = size
+        self._rows: list[ScoreInfo] = []
+        self._player_best: dict[str, Optional[ScoreInfo]] = {}
+        self.reload()
+
+    def reload(self):
+        # Rows are ascending by rank key, so bisect can keep them sorted on insert
+        self._rows = self.store.top(self.size)[::-1]
+        self._player_best.clear()
+
+    def add(self, score: ScoreInfo) -> Optional[int]:
+        self.store.add(score)
+
+        best = self._player_best.get(score.name)
+        if score.name in self._player_best and (best is None or rank_key(score) > rank_key(best)):
+            self._player_best[score.name] = score
+
+        if len(self._rows) >= self.size and rank_key(score) <= rank_key(self._rows[0]):
+            return None
+        index = bisect.bisect_left(self._rows, rank_key(score), key=rank_key)
+        self._rows.insert(index, score)
+        if len(self._rows) > self.size:
+            del self._rows[0]
+            index -= 1
+        return len(self._rows) - 1 - index
+
+    def top(self, n=None) -> list[ScoreInfo]:
+        n = self.size if n is None else n
+        if n > self.size:
+            return self.store.top(n)
+        return self._rows[::-1][:n]
+
+    def page(self, page: int, page_size: Optional[int] = None) -> list[ScoreInfo]:
+        page_size = self.size if page_size is None else page_size
+        offset = page * page_size
+        if offset + page_size <= self.size:
+            return self.top()[offset:offset + page_size]
+        return self.store.top(page_size, offset)
+
+    def player_best(self, name: str) -> Optional[ScoreInfo]:
+        if name not in self._player_best:
+            self._player_best[name] = self.store.player_best(name)
+        return self._player_best[name]
+
+    @property
+    def high_score(self):
+        if not self._rows:
+            return 0
+        return self._rows[-1].score
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
+
+import pygame
+from pygame.sprite import Sprite
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class PooledSprite(Sprite, ABC):
+    pool: Optional[SpritePool] = None
+
+    def kill(self):
+        # Only a live sprite goes back to the pool, so killing twice can't hand it out twice
+        if self.pool is not None and self.alive():
+            super().kill()
+            self.pool.release(self)
+        else:
+            super().kill()
+
+    @abstractmethod
+    def reset(self, *args):
+        pass
+
+
+class SpritePool:
+    def __init__(self, sprite_class: type[PooledSprite], ai_game: AlienInvasion):
+        # Each pool gets its own subclass so the pool is a class attribute, not a per-sprite reference
+        self.sprite_class = type(sprite_class.__name__, (sprite_class,), {'__slots__': (), 'pool': self})
+        self.ai_game = ai_game
+        self.free: list[PooledSprite] = []
+
+    def acquire(self, *args) -> PooledSprite:
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+        else:
+            sprite = self.sprite_class(self.ai_game, *args)
+        return sprite
+
+    def release(self, sprite: PooledSprite):
+        self.free.append(sprite)
+
+
+def kill_all(sprite_group: pygame.sprite.Group):
+    for sprite in sprite_group.sprites():
+        sprite.kill()
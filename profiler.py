@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import atexit
+import csv
+from collections import deque
+from time import perf_counter
+from typing import Optional
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Phase:
+    def __init__(self, profiler: FrameProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        frame = self.profiler.frame
+        frame[self.name] = frame.get(self.name, 0.0) + perf_counter() - self.start
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class FrameProfiler:
+    PHASES = (
+        'input', 'stars', 'ship', 'fleet', 'shelters', 'timers',
+        'draw_background', 'draw_ship', 'draw_fleet', 'draw_shelters', 'draw_ui', 'flip',
+    )
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, enabled=False, window=300, csv_path: Optional[str] = None):
+        # A CSV path means frames are wanted from the start
+        self.enabled = enabled or bool(csv_path)
+        self.overlay = False
+        self.csv_path = csv_path
+        self.frame: dict[str, float] = {}
+        self.frames = 0
+        self.samples = {name: deque(maxlen=window) for name in self.PHASES + ('total',)}
+        self._phases = {name: _Phase(self, name) for name in self.PHASES}
+        self._frame_start = perf_counter()
+        self._csv_file = None
+        self._csv_writer = None
+
+    def reset(self):
+        for samples in self.samples.values():
+            samples.clear()
+        self.frame.clear()
+        self._frame_start = perf_counter()
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._phases[name]
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        if self.overlay:
+            self.enabled = True
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+
+        now = perf_counter()
+        total = now - self._frame_start
+        self._frame_start = now
+        self.frames += 1
+
+        for name in self.PHASES:
+            if name in self.frame:
+                self.samples[name].append(self.frame[name])
+        self.samples['total'].append(total)
+
+        if self.csv_path:
+            self._write_csv(total)
+        self.frame.clear()
+
+    def _write_csv(self, total):
+        if self._csv_writer is None:
+            self._csv_file = open(self.csv_path, 'w', newline='')
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(('frame',) + self.PHASES + ('total',))
+            atexit.register(self.close)
+
+        self._csv_writer.writerow(
+            [self.frames]
+            + [f'{self.frame[name] * 1000:.4f}' if name in self.frame else '' for name in self.PHASES]
+            + [f'{total * 1000:.4f}']
+        )
+
+    def percentiles(self) -> dict[str, tuple[float, ...]]:
+        # Milliseconds per phase, nearest-rank over the rolling window
+        result = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[name] = tuple(
+                ordered[round(p / 100 * (len(ordered) - 1))] * 1000 for p in self.PERCENTILES
+            )
+        return result
+
+    def close(self):
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+
+
+class StartupTimer:
+    def __init__(self, start: Optional[float] = None):
+        self.times: dict[str, float] = {}
+        self._last = perf_counter() if start is None else start
+
+    def mark(self, name: str):
+        now = perf_counter()
+        self.times[name] = self.times.get(name, 0.0) + now - self._last
+        self._last = now
+
+    @property
+    def total(self):
+        return sum(self.times.values())
+
+    def report(self) -> str:
+        lines = [f"{name:<16}{seconds * 1000:8.1f} ms" for name, seconds in self.times.items()]
+        lines.append(f"{'total':<16}{self.total * 1000:8.1f} ms")
+        return '\n'.join(lines)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pygame
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+
+class DirtyRenderer:
+    def __init__(self, ai_game: AlienInvasion):
+        self.ai_game = ai_game
+        self.screen = ai_game.screen
+        self.rects: list[pygame.Rect] = []
+        self._game_state = None
+
+    def invalidate(self):
+        self._game_state = None
+
+    def update_screen(self):
+        ai = self.ai_game
+        # A scrolled background changes every pixel, so it falls back to a full redraw
+        full = ai.game_state != self._game_state or ai.stars.moved
+        self._game_state = ai.game_state
+
+        if ai.game_state == ai.game_state.PAUSE:
+            rects = ai.draw_foreground()
+            with ai.profiler.phase('flip'):
+                if full:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(rects)
+            return
+
+        if full:
+            ai.draw_background()
+            self.rects = ai.draw_foreground()
+            with ai.profiler.phase('flip'):
+                pygame.display.flip()
+            return
+
+        for rect in self.rects:
+            self.screen.set_clip(rect)
+            ai.draw_background()
+        self.screen.set_clip(None)
+
+        rects = ai.draw_foreground()
+        with ai.profiler.phase('flip'):
+            pygame.display.update(self.rects + rects)
+        self.rects = rects
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from alien_invasion import AlienInvasion
+from input_recording import InputPlayback, ReplayDesync, load_recording
+from settings import Settings
+
+
+def replay(path: str, render_every=0, spikes=10) -> dict:
+    recording = load_recording(path)
+    settings = Settings(**{
+        **recording['settings'],
+        'game_seed': recording['seed'],
+        'fullscreen': False,
+        'scores_file': ':memory:',
+        'legacy_scores_file': None,
+        'record_file': None,
+        'profiler_csv': None,
+    })
+    ai = AlienInvasion(headless=True, settings=settings)
+    ai.input.playback = playback = InputPlayback(ai, recording)
+
+    frame_times = []
+    desync = None
+    start = time.perf_counter()
+    try:
+        while not playback.finished:
+            frame_start = time.perf_counter()
+            ai.step(1, render_every)
+            frame_times.append(time.perf_counter() - frame_start)
+    except ReplayDesync as error:
+        desync = error
+    except SystemExit:
+        # The recorded session ended with a quit event
+        pass
+    elapsed = time.perf_counter() - start
+
+    slowest = sorted(range(len(frame_times)), key=frame_times.__getitem__, reverse=True)[:spikes]
+    return {
+        'frames': playback.frame,
+        'recorded_frames': len(recording['frames']),
+        'fps': round(playback.frame / elapsed, 2) if elapsed else 0,
+        'desync_frame': desync.frame if desync else None,
+        'slowest_frames': [(frame, round(frame_times[frame] * 1000, 3)) for frame in slowest],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded Alien Invasion session headlessly")
+    parser.add_argument('recording')
+    parser.add_argument('--render-every', type=int, default=0,
+                        help="render every k-th frame, 0 skips rendering")
+    parser.add_argument('--spikes', type=int, default=10, help="number of slowest frames to report")
+    args = parser.parse_args(argv)
+
+    result = replay(args.recording, args.render_every, args.spikes)
+    print(f"Replayed {result['frames']}/{result['recorded_frames']} frames at {result['fps']} fps")
+    for frame, ms in result['slowest_frames']:
+        print(f"  frame {frame}: {ms} ms")
+    if result['desync_frame'] is not None:
+        print(f"DESYNC at frame {result['desync_frame']}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import random
+from typing import Optional
+
+
+class RandomStreams:
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self._streams: dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        # String seeds are hashed with sha512, so every stream is reproducible and independent
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = random.Random(f"{self.seed}:{name}")
+        return stream
+
+    def reseed(self, seed: int):
+        self.seed = seed
+        for name, stream in self._streams.items():
+            stream.seed(f"{self.seed}:{name}")
+
+    def getstate(self):
+        return self.seed, {name: stream.getstate() for name, stream in self._streams.items()}
+
+    def setstate(self, state):
+        self.seed, streams = state
+        for name, stream_state in streams.items():
+            self.stream(name).setstate(stream_state)
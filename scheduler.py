@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Callable, Hashable, Optional
+
+
+class Scheduler:
+    def __init__(self):
+        self.time = 0.0
+        self._queue = []
+        self._timers = {}
+        self._counter = itertools.count()
+
+    def schedule(self, delay: float, callback: Callable[[], None], key: Optional[Hashable] = None):
+        if key is not None:
+            self.cancel(key)
+
+        timer = [self.time + delay, next(self._counter), callback, key]
+        heapq.heappush(self._queue, timer)
+        if key is not None:
+            self._timers[key] = timer
+        return timer
+
+    def cancel(self, key: Hashable):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            # Cancelled timers stay in the heap and are skipped when popped
+            timer[2] = None
+
+    def time_left(self, key: Hashable) -> Optional[float]:
+        timer = self._timers.get(key)
+        if timer is None:
+            return None
+        return timer[0] - self.time
+
+    def advance(self, seconds: float):
+        end_time = self.time + seconds
+        # Timers scheduled by callbacks during this advance get later ids
+        first_new = next(self._counter)
+        deferred = []
+        while self._queue and self._queue[0][0] <= end_time:
+            timer = heapq.heappop(self._queue)
+            fire_time, index, callback, key = timer
+            if callback is None:
+                continue
+            if index > first_new and fire_time <= self.time:
+                # Rescheduled without delay, it fires on the next advance instead of looping forever
+                deferred.append(timer)
+                continue
+            if key is not None:
+                del self._timers[key]
+            # Timers rescheduled from a callback keep their cadence instead of snapping to the frame
+            self.time = max(self.time, fire_time)
+            callback()
+
+        for timer in deferred:
+            heapq.heappush(self._queue, timer)
+        self.time = end_time
+
+    def clear(self):
+        self._queue.clear()
+        self._timers.clear()
+
+    def reset(self):
+        self.clear()
+        self.time = 0.0
+
+    def __contains__(self, key: Hashable):
+        return key in self._timers
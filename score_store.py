@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from collections import namedtuple
+from typing import Optional
+
+ScoreInfo = namedtuple('ScoreInfo', [
+    'score',
+    'level',
+    'time',
+    'name'
+])
+
+
+def rank_key(score: ScoreInfo):
+    return score.score, score.level, score.name
+
+
+class JsonScoreStore:
+    def __init__(self, path: Optional[str] = "scores.json"):
+        # path=None keeps the scores in memory only
+        self.path = path
+        self.scores: list[ScoreInfo] = []
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "r") as f:
+                self.scores = [ScoreInfo(*x) for x in json.load(f)]
+        except FileNotFoundError:
+            pass
+
+    def add(self, score: ScoreInfo):
+        self.scores.append(score)
+        if self.path is None:
+            return
+        with open(self.path, "w") as f:
+            json.dump(self.scores, f, indent=4)
+
+    def top(self, n, offset=0):
+        return sorted(self.scores, key=rank_key, reverse=True)[offset:offset + n]
+
+    def high_score(self):
+        if not self.scores:
+            return 0
+        return max(self.scores, key=lambda x: x.score).score
+
+    def player_best(self, name):
+        scores = [score for score in self.scores if score.name == name]
+        return max(scores, key=rank_key, default=None)
+
+    def __iter__(self):
+        return iter(self.scores)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def close(self):
+        pass
+
+
+class SqliteScoreStore:
+    def __init__(self, path="scores.db", migrate_from="scores.json"):
+        self.path = path
+        self.connection = sqlite3.connect(self.path)
+        self._create_tables(migrate_from)
+
+    def _create_tables(self, migrate_from):
+        with self.connection:
+            exists = self.connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'scores'"
+            ).fetchone()
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "id INTEGER PRIMARY KEY, score REAL, level INTEGER, time REAL, name TEXT)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS scores_rank ON scores (score DESC, level DESC, name DESC)"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS scores_player ON scores (name, score DESC, level DESC)"
+            )
+
+            if not exists and migrate_from and os.path.exists(migrate_from):
+                self.connection.executemany(
+                    "INSERT INTO scores (score, level, time, name) VALUES (?, ?, ?, ?)",
+                    JsonScoreStore(migrate_from).scores
+                )
+
+    def add(self, score: ScoreInfo):
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO scores (score, level, time, name) VALUES (?, ?, ?, ?)", score
+            )
+
+    def top(self, n, offset=0):
+        rows = self.connection.execute(
+            "SELECT score, level, time, name FROM scores "
+            "ORDER BY score DESC, level DESC, name DESC LIMIT ? OFFSET ?", (n, offset)
+        )
+        return [ScoreInfo(*row) for row in rows]
+
+    def high_score(self):
+        row = self.connection.execute("SELECT MAX(score) FROM scores").fetchone()
+        return row[0] or 0
+
+    def player_best(self, name):
+        row = self.connection.execute(
+            "SELECT score, level, time, name FROM scores WHERE name = ? "
+            "ORDER BY score DESC, level DESC LIMIT 1", (name,)
+        ).fetchone()
+        return ScoreInfo(*row) if row else None
+
+    def __iter__(self):
+        rows = self.connection.execute("SELECT score, level, time, name FROM scores ORDER BY id")
+        return (ScoreInfo(*row) for row in rows)
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+
+def create_score_store(settings):
+    match settings.score_store:
+        case 'sqlite':
+            return SqliteScoreStore(settings.scores_file, migrate_from=settings.legacy_scores_file)
+        case 'json':
+            return JsonScoreStore(settings.legacy_scores_file)
+    raise ValueError(f'Unknown score store: {settings.score_store}')
@@ -1,21 +1,38 @@
-import pygame
-
-
 class Settings:
-    def __init__(self):
+    def __init__(self, **overrides):
         self.fullscreen = False
+        self.render_scaling = False  # fullscreen draws at screen_width x screen_height and is scaled to the display
+        self.render_filter = 'nearest'  # 'nearest' or 'smooth', used with render_scaling
         self.screen_width = 1280
         self.screen_height = 800
         self.bg_color = (25, 25, 25)
         self.bg_color_game_over = (75, 25, 25)
         self.tick_rate = 100
         self.default_player_name = "Player"
+        self.fast_start = True  # init only display/font/event and build the fleet when a game starts
+        self.startup_report = False  # print a startup timing breakdown after the first frame
+        self.font_name = None  # None = pygame default font, system fonts are looked up once
+        self.font_cache_file = ".font_cache.json"
+        self.game_seed = None  # None = random, every subsystem gets its own stream derived from it
+        self.score_store = 'sqlite'  # 'sqlite' or 'json'
+        self.scores_file = "scores.db"
+        self.legacy_scores_file = "scores.json"
+        self.leaderboard_size = 10
+        self.surface_cache_size = 512
+        self.text_cache_size = 256
+        self.collision_cell_size = 64
+        self.profiler_enabled = False  # F3 toggles the overlay and enables it
+        self.profiler_window = 300
+        self.profiler_csv = None  # e.g. "frames.csv", enables the profiler
+        self.record_file = None  # e.g. "recording.json", replay it with replay.py
+        self.dirty_rendering = False  # pays off when the stars scroll slower than a pixel per frame
 
         self.stars_seed = 255  # 0 = always random
         self.stars_scale_min_max = 3, 6
         self.stars_transparency_min_max = 170, 250
         self.stars_num = 100
         self.stars_speed = 1
+        self.stars_layers_speed = (1,)  # e.g. (1, .6, .3) for parallax
 
         self.ship_speed = 3
         self.ships_lives = 2
@@ -38,6 +55,7 @@ class Settings:
         self.start_offset_y = 50
         self.border_offset_x = 10
 
+        self.fleet_backend = 'sprites'  # 'sprites' or 'numpy'
         self.fleet_drop_speed = 20
         self.fleet_direction = 1
         self.alien_speed = 1
@@ -49,8 +67,7 @@ class Settings:
             (0, 200, 0),
             (0, 0, 200)
         )
-        self.alien_shoot_timer = 5 * 100
-        self.alien_shoot_event = pygame.USEREVENT + 1
+        self.alien_shoot_timer = 5 * 100  # ms of game time
 
         self.shelter_count = 3
         self.shelter_pos_y = 130
@@ -62,6 +79,13 @@ class Settings:
 
         self.speedup_scale = 1.1
         self.score_scale = 1.25
+
+        self.overrides = overrides
+        for name, value in overrides.items():
+            if not hasattr(self, name):
+                raise AttributeError(f'Unknown setting: {name}')
+            setattr(self, name, value)
+
         self.initialize_dynamic_settings()
 
     def initialize_dynamic_settings(self):
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import pygame
-from pygame.sprite import Sprite
 
 from typing import TYPE_CHECKING
 
@@ -25,9 +24,7 @@ class ShelterBlocks:
             self.shelters.append(shelter)
 
     def update_screen(self):
-        for shelter in self.shelters:
-            for brick in shelter.bricks.sprites():
-                brick.draw(self.screen)
+        return self.screen.blits((shelter.image, shelter.rect) for shelter in self.shelters)
 
     def update(self):
         for s in self.shelters:
@@ -37,45 +34,89 @@ class ShelterBlocks:
 class Shelter:
     def __init__(self, ai_game: AlienInvasion, pos):
         self.pos = pos
-        # print(pos)
         self.ai_game = ai_game
         self.settings = ai_game.settings
 
-        self.bricks = self._create_bricks()
+        self.brick_size = self.settings.shelter_brick_size
+        self.brick_distance = self.settings.shelter_brick_size + self.settings.shelter_brick_distance
+        self.layout = self._create_bricks()
+        self.bricks = dict(self.layout)
+        self._create_image()
 
     def _create_bricks(self):
-        bricks = pygame.sprite.Group()
+        bricks = {}
         num_x = self.settings.shelter_width
         num_y = self.settings.shelter_height
         num_x = num_x if num_x % 2 else num_x - 1
         offset_x = num_x // 2
         offset_y = num_y // 2
-        brick_distance = self.settings.shelter_brick_size + self.settings.shelter_brick_distance
         for x_pos in range(num_x):
             for y_pos in range(num_y):
-                x = self.pos[0] + (x_pos - offset_x) * brick_distance
-                y = self.pos[1] + (y_pos - offset_y) * brick_distance
+                x = self.pos[0] + (x_pos - offset_x) * self.brick_distance
+                y = self.pos[1] + (y_pos - offset_y) * self.brick_distance
 
-                brick = ShelterBrick(self, (x, y))
-                bricks.add(brick)
-            continue
+                brick = pygame.Rect(0, 0, self.brick_size, self.brick_size)
+                brick.center = (x, y)
+                bricks[x_pos, y_pos] = brick
         return bricks
 
-    def update(self):
-        pygame.sprite.groupcollide(self.ai_game.ship.bullets, self.bricks, True, True)
-        pygame.sprite.groupcollide(self.ai_game.fleet.bullets, self.bricks, True, True)
-        pygame.sprite.groupcollide(self.ai_game.fleet.aliens, self.bricks, False, True)
-
+    def _create_image(self):
+        self.rect = pygame.Rect(self.layout[0, 0]).unionall(list(self.layout.values()))
+        self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.mask = pygame.mask.Mask(self.rect.size)
+        self._brick_mask = pygame.mask.Mask((self.brick_size, self.brick_size), fill=True)
+        self._draw_bricks()
+
+    def _draw_bricks(self):
+        self.image.fill((0, 0, 0, 0))
+        self.mask.clear()
+        for brick in self.bricks.values():
+            local = brick.move(-self.rect.x, -self.rect.y)
+            self.image.fill(self.settings.shelter_color, local)
+            self.mask.draw(self._brick_mask, local.topleft)
+
+    def collide(self, rect: pygame.Rect):
+        if not self.bricks or not self.rect.colliderect(rect):
+            return False
+        area = pygame.mask.Mask(rect.size, fill=True)
+        return self.mask.overlap(area, (rect.x - self.rect.x, rect.y - self.rect.y)) is not None
+
+    def damage(self, rect: pygame.Rect):
+        if not self.collide(rect):
+            return False
+
+        # Bricks form a regular grid starting at the shelter top left corner
+        left, top = self.rect.topleft
+        x_start = max(0, (rect.left - left - self.brick_size) // self.brick_distance)
+        y_start = max(0, (rect.top - top - self.brick_size) // self.brick_distance)
+        x_end = (rect.right - left) // self.brick_distance
+        y_end = (rect.bottom - top) // self.brick_distance
+
+        for x_pos in range(x_start, x_end + 1):
+            for y_pos in range(y_start, y_end + 1):
+                brick = self.bricks.get((x_pos, y_pos))
+                if brick is not None and brick.colliderect(rect):
+                    self._erase(x_pos, y_pos)
+        return True
+
+    def restore_bricks(self, keys):
+        keys = set(keys)
+        if keys == self.bricks.keys():
+            return
+        self.bricks = {key: brick for key, brick in self.layout.items() if key in keys}
+        self._draw_bricks()
+
+    def _erase(self, x_pos, y_pos):
+        brick = self.bricks.pop((x_pos, y_pos))
+        local = brick.move(-self.rect.x, -self.rect.y)
+        self.image.fill((0, 0, 0, 0), local)
+        self.mask.erase(self._brick_mask, local.topleft)
 
-class ShelterBrick(Sprite):
-    def __init__(self, shelter: Shelter, pos):
-        super().__init__()
-        self.shelter = shelter
-        self.color = self.shelter.settings.shelter_color
-
-        self.rect = pygame.Rect(0, 0, self.shelter.settings.shelter_brick_size,
-                                self.shelter.settings.shelter_brick_size)
-        self.rect.center = pos
+    def update(self):
+        for bullets in (self.ai_game.ship.bullets, self.ai_game.fleet.bullets):
+            for bullet in bullets.sprites():
+                if self.damage(bullet.rect):
+                    bullet.kill()
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, self.rect)
+        for alien in self.ai_game.fleet.grid.collide(self.rect):
+            self.damage(alien.rect)
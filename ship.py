@@ -6,6 +6,8 @@ import pygame
 from pygame.sprite import Sprite
 from typing import TYPE_CHECKING
 from bullet import Bullet
+from image_cache import surface_cache
+from pool import SpritePool, kill_all
 
 if TYPE_CHECKING:
     from alien_invasion import AlienInvasion
@@ -19,7 +21,8 @@ class Ship(Sprite):
         self.screen_rect = ai_game.screen.get_rect()
         self.settings = ai_game.settings
 
-        self.image = pygame.image.load('images/ship.png').convert_alpha()
+        # Copied because the shield bonus changes the ship alpha
+        self.image = surface_cache.get('images/ship.png').copy()
         self.rect = self.image.get_rect()
 
         self.rect.midbottom = self.screen_rect.midbottom
@@ -28,6 +31,7 @@ class Ship(Sprite):
         self.moving_right = False
 
         self.bullets = pygame.sprite.Group()
+        self.bullet_pool = SpritePool(Bullet, ai_game)
 
     def update(self):
         if self.moving_left and self.rect.left > 0:
@@ -48,28 +52,25 @@ class Ship(Sprite):
         return 0
 
     def update_screen(self):
-        self.screen.blit(self.image, self.rect)
-
-        for bullet in self.bullets.sprites():
-            bullet.draw_bullet()
+        return self.screen.blits([(self.image, self.rect)] +
+                                 [(bullet.image, bullet.rect) for bullet in self.bullets])
 
     def reset_ship(self):
         self.rect.midbottom = self.screen_rect.midbottom
         self.x = float(self.rect.x)
 
-        self.bullets.empty()
+        kill_all(self.bullets)
 
     def fire_bullet(self):
         if self.ai_game.stats.unlimited_ammo or len(self.bullets) < self.settings.bullets_allowed:
-            new_bullet = Bullet(self.ai_game, self)
+            new_bullet = self.bullet_pool.acquire(self)
             self.bullets.add(new_bullet)
 
     def _update_bullets(self):
-        self.bullets.update()
-
-        for bullet in self.bullets.copy():
+        for bullet in self.bullets.sprites():
+            bullet.update(self.settings.bullet_speed_factor)
             if bullet.rect.bottom <= 0:
-                self.bullets.remove(bullet)
+                bullet.kill()
 
         self.ai_game.fleet.check_bullet_alien_collisions(self.bullets)
 
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import marshal
+from typing import TYPE_CHECKING
+
+from alien import Alien
+from bonuses import BonusType
+from pool import kill_all
+from shelter import Shelter
+
+if TYPE_CHECKING:
+    from alien_invasion import AlienInvasion
+
+SNAPSHOT_MAGIC = b'AISV'
+SNAPSHOT_VERSION = 2
+# marshal only builds plain values, unlike pickle loading a shared save file can't run code
+MARSHAL_VERSION = 4
+
+DYNAMIC_SETTINGS = ('ship_speed_factor', 'bullet_speed_factor', 'alien_speed_factor',
+                    'alien_shoot_timer_factor', 'fleet_direction', 'alien_points')
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def save_state(ai: AlienInvasion, include_rng=True) -> bytes:
+    # Only plain numbers and tuples are stored, surfaces and sprites are reused on restore
+    stats = ai.stats
+    ship = ai.ship
+    fleet = ai.fleet
+    fleet.sync_positions()
+    state = (
+        ai.game_state.value,
+        ai.frame,
+        tuple(getattr(ai.settings, name) for name in DYNAMIC_SETTINGS),
+        (stats.score, stats.level, stats.ships_lives, stats.high_score, stats.start_time,
+         stats.game_active, tuple((bonus.value, end) for bonus, end in stats.bonuses.items())),
+        (ai.timers.time, ai.timers.time_left('alien_shoot')),
+        (ship.x, ship.rect.x, ship.moving_left, ship.moving_right),
+        tuple((bullet.rect.x, bullet.rect.y, bullet.y) for bullet in ship.bullets),
+        tuple((alien.row, alien.num, alien.x, alien.y, alien.rect.x, alien.rect.y)
+              for alien in fleet.aliens),
+        tuple((bullet.rect.x, bullet.rect.y, bullet.y) for bullet in fleet.bullets),
+        tuple((bonus.bonus_type.value, bonus.rect.center, bonus.y) for bonus in fleet.bonuses),
+        tuple((shelter.pos, tuple(shelter.bricks)) for shelter in ai.shelters.shelters),
+        tuple((layer.x, layer.y) for layer in ai.stars.layers),
+        ai.rng.getstate() if include_rng else None,
+    )
+    return SNAPSHOT_MAGIC + bytes((SNAPSHOT_VERSION,)) + marshal.dumps(state, MARSHAL_VERSION)
+
+
+def load_state(ai: AlienInvasion, data: bytes, update_ui=True):
+    header = len(SNAPSHOT_MAGIC)
+    if data[:header] != SNAPSHOT_MAGIC:
+        raise SnapshotError('Not an Alien Invasion snapshot')
+    version = data[header]
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f'Unsupported snapshot version {version}')
+    try:
+        state = marshal.loads(data[header + 1:])
+    except (EOFError, ValueError, TypeError) as error:
+        raise SnapshotError(f'Corrupted snapshot: {error}') from None
+    if not isinstance(state, tuple) or len(state) != 13:
+        raise SnapshotError('Corrupted snapshot: unexpected layout')
+
+    (game_state, frame, settings, stats_state, timers_state, ship_state, ship_bullets,
+     aliens, alien_bullets, bonuses, shelters, stars, rng_state) = state
+
+    ai.game_state = type(ai.game_state)(game_state)
+    ai.frame = frame
+    for name, value in zip(DYNAMIC_SETTINGS, settings):
+        setattr(ai.settings, name, value)
+    if rng_state is not None:
+        ai.rng.setstate(rng_state)
+
+    _restore_timers(ai, stats_state, timers_state)
+    _restore_ship(ai, ship_state, ship_bullets)
+    _restore_fleet(ai, aliens, alien_bullets, bonuses)
+    _restore_shelters(ai, shelters)
+    for layer, (x, y) in zip(ai.stars.layers, stars):
+        layer.x, layer.y = x, y
+
+    # Everything on screen may have moved, so the next dirty-rect frame is a full redraw
+    if ai.renderer:
+        ai.renderer.invalidate()
+
+    if update_ui:
+        ai.ui.update_score()
+        ai.ui.update_level()
+        ai.ui.update_ships_lives()
+        ai.ui.update_bonuses()
+
+
+def _restore_timers(ai: AlienInvasion, stats_state, timers_state):
+    stats = ai.stats
+    (stats.score, stats.level, stats.ships_lives, stats.high_score, stats.start_time,
+     stats.game_active, bonuses) = stats_state
+    time, shoot_left = timers_state
+
+    timers = ai.timers
+    timers.clear()
+    timers.time = time
+    if shoot_left is not None:
+        timers.schedule(shoot_left, ai.fleet.fire_random_bullet, key='alien_shoot')
+
+    stats.restore_bonuses({BonusType(bonus): end for bonus, end in bonuses})
+
+
+def _restore_ship(ai: AlienInvasion, ship_state, bullets):
+    ship = ai.ship
+    ship.x, ship.rect.x, ship.moving_left, ship.moving_right = ship_state
+    _restore_bullets(ship.bullets, ship.bullet_pool, ship, bullets)
+
+
+def _restore_bullets(group, pool, ship, bullets):
+    kill_all(group)
+    for x, rect_y, y in bullets:
+        bullet = pool.acquire(ship)
+        bullet.rect.topleft = x, rect_y
+        bullet.y = y
+        group.add(bullet)
+
+
+def _restore_fleet(ai: AlienInvasion, aliens, bullets, bonuses):
+    fleet = ai.fleet
+    fleet.aliens.empty()
+    for row, num, x, y, rect_x, rect_y in aliens:
+        # Aliens of the current level are reused, only unknown slots need a new sprite
+        alien = fleet.alien_slots.get((row, num))
+        if alien is None:
+            alien = fleet.alien_slots[row, num] = Alien(fleet, row, num)
+        alien.x, alien.y = x, y
+        alien.rect.topleft = rect_x, rect_y
+        fleet.aliens.add(alien)
+
+    fleet.grid.rebuild(fleet.aliens)
+    fleet.build_frontline()
+
+    _restore_bullets(fleet.bullets, fleet.bullet_pool, ai.ship, bullets)
+
+    kill_all(fleet.bonuses)
+    for bonus_type, center, y in bonuses:
+        bonus = fleet.bonus_pool.acquire(center, BonusType(bonus_type))
+        bonus.y = y
+        fleet.bonuses.add(bonus)
+
+
+def _restore_shelters(ai: AlienInvasion, shelters):
+    blocks = ai.shelters
+    current = {shelter.pos: shelter for shelter in blocks.shelters}
+    blocks.shelters = []
+    for pos, bricks in shelters:
+        shelter = current.get(pos) or Shelter(ai, pos)
+        shelter.restore_bricks(bricks)
+        blocks.shelters.append(shelter)
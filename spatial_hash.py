@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Iterable, Union
+
+import pygame
+from pygame.sprite import Sprite
+
+
+class SpatialHash:
+    def __init__(self, cell_size=64, sprites: Iterable[Sprite] = ()):
+        self.cell_size = cell_size
+        self._cells: defaultdict[tuple, dict[Sprite, None]] = defaultdict(dict)
+        # sprite -> (cell span, cells, insertion order)
+        self._sprites: dict[Sprite, tuple[tuple, list, int]] = {}
+        self._counter = 0
+
+        for sprite in sprites:
+            self.add(sprite)
+
+    def _span(self, rect: pygame.Rect):
+        size = self.cell_size
+        return rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    def _cells_for(self, rect: pygame.Rect):
+        return self._span_cells(self._span(rect))
+
+    @staticmethod
+    def _span_cells(span):
+        left, top, right, bottom = span
+        return [(x, y) for x in range(left, right + 1) for y in range(top, bottom + 1)]
+
+    def add(self, sprite: Sprite):
+        if sprite in self._sprites:
+            self.remove(sprite)
+        self._insert(sprite, self._span(sprite.rect), self._counter)
+        self._counter += 1
+
+    def _insert(self, sprite: Sprite, span, order):
+        cells = self._span_cells(span)
+        for cell in cells:
+            self._cells[cell][sprite] = None
+        self._sprites[sprite] = span, cells, order
+
+    def remove(self, sprite: Sprite):
+        entry = self._sprites.pop(sprite, None)
+        if entry is None:
+            return
+        for cell in entry[1]:
+            bucket = self._cells[cell]
+            bucket.pop(sprite, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def update(self, sprites: Iterable[Sprite]):
+        # Moving sprites rarely leave their cells, so only the ones whose cell span changed are re-bucketed
+        size = self.cell_size
+        entries = self._sprites
+        for sprite in sprites:
+            entry = entries.get(sprite)
+            if entry is None:
+                self.add(sprite)
+                continue
+            rect = sprite.rect
+            span = rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size
+            if span != entry[0]:
+                self.remove(sprite)
+                self._insert(sprite, span, entry[2])
+
+    def rebuild(self, sprites: Iterable[Sprite]):
+        self.clear()
+        for sprite in sprites:
+            self.add(sprite)
+
+    def clear(self):
+        self._cells.clear()
+        self._sprites.clear()
+        self._counter = 0
+
+    def collide(self, rect: pygame.Rect) -> list[Sprite]:
+        found = {}
+        for cell in self._cells_for(rect):
+            bucket = self._cells.get(cell)
+            if not bucket:
+                continue
+            for sprite in bucket:
+                # Sprites killed outside of the hash are dropped here
+                if sprite.alive() and rect.colliderect(sprite.rect):
+                    found[sprite] = None
+
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=lambda sprite: self._sprites[sprite][2])
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def __contains__(self, sprite: Sprite):
+        return sprite in self._sprites
+
+
+def groupcollide(groupa: pygame.sprite.Group, groupb: Union[SpatialHash, pygame.sprite.Group, Any],
+                 dokilla: bool, dokillb: bool, cell_size=64) -> dict[Sprite, list[Sprite]]:
+    # Same kill semantics as pygame.sprite.groupcollide, with groupb looked up through a spatial hash
+    if isinstance(groupb, pygame.sprite.AbstractGroup):
+        groupb = SpatialHash(cell_size, groupb.sprites())
+
+    crashed = {}
+    for sprite in groupa.sprites():
+        collided = groupb.collide(sprite.rect)
+        if not collided:
+            continue
+
+        if dokillb:
+            for other in collided:
+                other.kill()
+                groupb.remove(other)
+        crashed[sprite] = collided
+        if dokilla:
+            sprite.kill()
+    return crashed
@@ -1,8 +1,8 @@
 from __future__ import annotations
 import pygame
-from pygame.sprite import Sprite
 import random
 
+from image_cache import surface_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,44 +14,102 @@ class StarsBackground:
         self.ai_game = ai_game
         self.settings = ai_game.settings
         self.screen = ai_game.screen
-        self.stars = pygame.sprite.Group()
+        self.layers: list[StarLayer] = []
 
         self._create_stars()
 
     def _create_stars(self):
         if self.settings.stars_seed != 0:
-            random.seed(self.settings.stars_seed)
-        for x in range(self.settings.stars_num):
-            star = Star(self)
-            self.stars.add(star)
-        random.seed(None)
+            self.rng = random.Random(self.settings.stars_seed)
+        else:
+            self.rng = self.ai_game.rng.stream('stars')
+
+        speeds = self.settings.stars_layers_speed
+        for n, speed in enumerate(speeds):
+            stars_num = self.settings.stars_num // len(speeds)
+            if n < self.settings.stars_num % len(speeds):
+                stars_num += 1
+            self.layers.append(StarLayer(self, stars_num, speed, opaque=n == 0))
+
+    def update(self):
+        for layer in self.layers:
+            layer.update()
+
+    def reset(self):
+        for layer in self.layers:
+            layer.x = layer.y = 0.0
+
+    @property
+    def opaque(self):
+        return bool(self.layers) and self.layers[0].opaque
+
+    @property
+    def moved(self):
+        return any(layer.moved for layer in self.layers)
 
     def update_screen(self):
-        self.stars.draw(self.screen)
+        rects = []
+        for layer in self.layers:
+            rects += layer.draw(self.screen)
+        return rects
 
 
-class Star(Sprite):
-    def __init__(self, stars: StarsBackground):
-        super().__init__()
+class StarLayer:
+    def __init__(self, stars: StarsBackground, stars_num, speed, opaque=True):
         self.stars = stars
         self.settings = stars.settings
+        self.speed = speed
+        self.opaque = opaque
+        self.width = self.settings.screen_width
+        self.height = self.settings.screen_height
+
+        # Stars are baked over the background color, upper layers key it out again
+        self.image = pygame.Surface((self.width, self.height))
+        self.image.fill(self.settings.bg_color)
+        for _ in range(stars_num):
+            self._draw_star()
+        self.image = self.image.convert()
+        if not opaque:
+            self.image.set_colorkey(self.settings.bg_color, pygame.RLEACCEL)
+
+        self.x = 0.0
+        self.y = 0.0
+        self.drawn_offset = None
+
+    def _draw_star(self):
+        rng = self.stars.rng
+        scale = rng.randint(*self.settings.stars_scale_min_max)
+        transparency = rng.randint(*self.settings.stars_transparency_min_max)
+
+        # Rotation and alpha are random per star, so only the scaled image is worth caching
+        image = surface_cache.get("images/star3.png", scale=(scale, scale))
+        image = pygame.transform.rotate(image, rng.randint(0, 360))
+        image.fill((255, 255, 255, rng.randint(3, transparency)),
+                   special_flags=pygame.BLEND_RGBA_MULT)
+
+        x = rng.randint(0, self.width)
+        y = rng.randint(0, self.height)
+        width, height = image.get_size()
+        for dx in (0, -self.width) if x + width > self.width else (0,):
+            for dy in (0, -self.height) if y + height > self.height else (0,):
+                self.image.blit(image, (x + dx, y + dy))
+
+    def update(self):
+        self.x += self.settings.stars_speed * self.stars.ai_game.ship.speed * -1 * 0.25 * self.speed
+        self.y += self.settings.stars_speed * self.speed
+
+    @property
+    def offset(self):
+        return round(self.x) % self.width, round(self.y) % self.height
+
+    @property
+    def moved(self):
+        return self.offset != self.drawn_offset
 
-        self.image = pygame.image.load("images/star3.png").convert_alpha()
-        self.scale = random.randint(*self.settings.stars_scale_min_max)
-        self.transparency = random.randint(*self.settings.stars_transparency_min_max)
-
-        self.image = pygame.transform.scale(self.image, (self.scale, self.scale))
-        self.image = pygame.transform.rotate(self.image, random.randint(0, 360))
-        self.image.fill((255, 255, 255, random.randint(3, self.transparency)),
-                        special_flags=pygame.BLEND_RGBA_MULT)
-
-        self.rect = self.image.get_rect()
-        self.rect.y = random.randint(0, self.settings.screen_height)
-        self.x = random.randint(0, self.settings.screen_width)
-        self.y = random.randint(0, self.settings.screen_height)
-
-    def update(self) -> None:
-        self.x += self.settings.stars_speed * self.stars.ai_game.ship.speed * -1 * 0.25
-        self.y += self.settings.stars_speed
-        self.rect.x = self.x % self.settings.screen_width
-        self.rect.y = self.y % self.settings.screen_height
+    def draw(self, screen: pygame.Surface):
+        self.drawn_offset = offset_x, offset_y = self.offset
+        return screen.blits(
+            (self.image, (x, y))
+            for x in ((offset_x - self.width, offset_x) if offset_x else (0,))
+            for y in ((offset_y - self.height, offset_y) if offset_y else (0,))
+        )
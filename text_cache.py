@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from typing import Optional
+
+import pygame.font
+
+
+class TextCache:
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._fonts: dict[int, pygame.font.Font] = {}
+        self.font_name: Optional[str] = None
+        self.font_cache_file: Optional[str] = None
+        self._font_path: Optional[str] = None
+        self._texts: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def set_font(self, name: Optional[str], cache_file: Optional[str] = None):
+        self.font_name = name
+        self.font_cache_file = cache_file
+        self._font_path = self._resolve_font(name)
+        self._fonts.clear()
+        self._texts.clear()
+
+    def _resolve_font(self, name: Optional[str]) -> Optional[str]:
+        # Scanning the system fonts spawns fc-list, so resolved paths are kept on disk between runs
+        if name is None:
+            return None
+
+        paths = {}
+        if self.font_cache_file and os.path.exists(self.font_cache_file):
+            with open(self.font_cache_file) as file:
+                paths = json.load(file)
+        # Fonts that were not found are cached as None and fall back to the default font
+        path = paths.get(name)
+        if name in paths and (path is None or os.path.exists(path)):
+            return path
+
+        path = paths[name] = pygame.font.match_font(name)
+        if self.font_cache_file:
+            with open(self.font_cache_file, 'w') as file:
+                json.dump(paths, file, indent=4)
+        return path
+
+    def font(self, size: int) -> pygame.font.Font:
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(self._font_path, size)
+        return font
+
+    def render(self, text: str, size: int, color: tuple,
+               background: Optional[tuple] = None) -> pygame.Surface:
+        # Returned surfaces are shared, copy them before drawing on them
+        key = (text, size, color, background)
+        image = self._texts.get(key)
+        if image is not None:
+            self.hits += 1
+            self._texts.move_to_end(key)
+            return image
+
+        self.misses += 1
+        image = self._texts[key] = self.font(size).render(text, True, color, background)
+        while len(self._texts) > self.max_size:
+            self._texts.popitem(last=False)
+        return image
+
+    def render_number(self, text: str, size: int, color: tuple,
+                      background: Optional[tuple] = None) -> pygame.Surface:
+        # Built from cached per-character glyphs, so a changing counter never renders new text
+        glyphs = [self.render(char, size, color, background) for char in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        height = max((glyph.get_height() for glyph in glyphs), default=self.font(size).get_height())
+
+        if background is None:
+            image = pygame.Surface((width, height), pygame.SRCALPHA)
+        else:
+            image = pygame.Surface((width, height))
+            image.fill(background)
+
+        x = 0
+        for glyph in glyphs:
+            image.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return image
+
+    def resize(self, max_size):
+        self.max_size = max_size
+        while len(self._texts) > self.max_size:
+            self._texts.popitem(last=False)
+
+    def clear(self):
+        self._fonts.clear()
+        self._texts.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+text_cache = TextCache()
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import pygame.font
-from pygame.sprite import Group
-import pygame_textinput
+from pygame.sprite import Group, Sprite
 
 from button import Button
-from ship import Ship
 from bonuses import BonusSprite
+from image_cache import surface_cache
+from text_cache import text_cache
 
 from typing import TYPE_CHECKING
 
@@ -25,7 +25,9 @@ class UI:
         self.text_color = (230, 230, 230)
         self.play_button = Button(ai_game, "Press P to Start")
 
-        self._prep_name_input()
+        pygame.key.set_repeat(200, 25)
+        self._name_input = None
+        self.profiler_images = []
         self._prep_menu_images()
 
         self.update_score()
@@ -35,8 +37,12 @@ class UI:
         self.update_bonuses()
 
     def _prep_text(self, text, font_size=48):
-        font = pygame.font.SysFont(None, font_size)
-        image = font.render(text, True, self.text_color, self.settings.bg_color)
+        image = text_cache.render(text, font_size, self.text_color, self.settings.bg_color)
+        image_rect = image.get_rect()
+        return image, image_rect
+
+    def _prep_number(self, text, font_size=48):
+        image = text_cache.render_number(text, font_size, self.text_color, self.settings.bg_color)
         image_rect = image.get_rect()
         return image, image_rect
 
@@ -66,6 +72,7 @@ class UI:
 
     def _prep_highscore_list(self):
         self.highscore_list = []
+        self.highscore_rows = {}
         self.titles_names = ("Name", "Score", "Level", "Time (Minutes)")
         self.highscore_field_size = 200
         self.highscore_offset = (len(self.titles_names) - 1) / 2 * self.highscore_field_size
@@ -87,40 +94,54 @@ class UI:
 
         self.update_highscore_list()
 
+    @property
+    def name_input(self):
+        # Only needed on the game over screen
+        if self._name_input is None:
+            self._prep_name_input()
+        return self._name_input
+
     def _prep_name_input(self):
-        pygame.key.set_repeat(200, 25)
-        self.name_input = pygame_textinput.TextInputVisualizer(
+        import pygame_textinput
+
+        self._name_input = pygame_textinput.TextInputVisualizer(
             font_color=self.text_color,
             cursor_color=self.text_color,
         )
         text = self.settings.default_player_name
-        self.name_input.value = text
-        self.name_input.manager.cursor_pos = len(text)
+        self._name_input.value = text
+        self._name_input.manager.cursor_pos = len(text)
 
     def update_highscore_list(self):
         title_text_size = len(self.titles_names) + 1
         self.highscore_list[title_text_size:] = []
 
-        scores = sorted(self.stats.score_history, key=lambda x: (
-            x.score, x.level, x.name
-        ), reverse=True)[:10]
+        scores = self.stats.leaderboard.top()
 
         height = self.highscore_list[-1][1].centery
 
+        # Rows are rendered once per score and only moved when their rank changes
+        rows = {}
         for i, score in enumerate(scores):
-            items = score.name, f"{round(score.score):,}", score.level, round(score.time / 60, 2)
+            images = self.highscore_rows.get(score) or self._prep_highscore_row(score)
+            rows[score] = images
 
-            for n, item in enumerate(items):
-                score_image = self._prep_text(str(item), 32)
-                score_image[1].center = (
+            for n, image in enumerate(images):
+                score_rect = image.get_rect()
+                score_rect.center = (
                     self.title_image[1].centerx - self.highscore_offset + self.highscore_field_size * n,
                     height + (35 * i) + 45,
                 )
-                self.highscore_list.append(score_image)
+                self.highscore_list.append((image, score_rect))
+        self.highscore_rows = rows
+
+    def _prep_highscore_row(self, score):
+        items = score.name, f"{round(score.score):,}", score.level, round(score.time / 60, 2)
+        return [self._prep_text(str(item), 32)[0] for item in items]
 
     def update_score(self):
         score_str = f"{round(self.stats.score):,}"
-        self.score_image, self.score_rect = self._prep_text(score_str)
+        self.score_image, self.score_rect = self._prep_number(score_str)
         self.score_rect.centerx = self.screen_rect.centerx
         self.score_rect.top = self.screen_rect.top + 15
 
@@ -141,11 +162,13 @@ class UI:
 
     def update_ships_lives(self):
         self.ships = Group()
+        image = surface_cache.get('images/ship.png')
         for ship_live in range(self.stats.ships_lives):
-            ship = Ship(self.ai_game)
+            ship = Sprite(self.ships)
+            ship.image = image
+            ship.rect = image.get_rect()
             ship.rect.x = 10 + ship_live * (ship.rect.width + 10)
             ship.rect.y = 10
-            self.ships.add(ship)
 
     def update_bonuses(self):
         self.bonuses = Group()
@@ -155,31 +178,62 @@ class UI:
             self.bonuses.add(bonus)
 
     def show_menu(self):
-        self.screen.blit(*self.title_image)
-        self.play_button.draw_button()
+        rects = [self.screen.blit(*self.title_image)]
+        rects += self.play_button.draw_button()
 
-        for hs in self.highscore_list:
-            self.screen.blit(*hs)
+        rects += self.screen.blits(self.highscore_list)
+        return rects
 
     def show_score(self):
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.high_score_image, self.high_score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self.bonuses.draw(self.screen)
-        self.ships.draw(self.screen)
+        rects = [
+            self.screen.blit(self.score_image, self.score_rect),
+            self.screen.blit(self.high_score_image, self.high_score_rect),
+            self.screen.blit(self.level_image, self.level_rect),
+        ]
+        rects += self.screen.blits((bonus.image, bonus.rect) for bonus in self.bonuses)
+        rects += self.screen.blits((ship.image, ship.rect) for ship in self.ships)
+        return rects
+
+    def show_profiler(self):
+        if self.ai_game.profiler.frames % 30 == 1 or not self.profiler_images:
+            self._prep_profiler_images()
+        return self.screen.blits(self.profiler_images)
+
+    def _prep_profiler_images(self):
+        # Values change every frame, so they are rendered directly instead of going through the text cache
+        font = text_cache.font(20)
+        rows = [("phase (ms)", "p50", "p95", "p99")]
+        for name, values in self.ai_game.profiler.percentiles().items():
+            rows.append((name, *(f"{value:.2f}" for value in values)))
+
+        self.profiler_images = []
+        top = self.screen_rect.top + 140
+        for row in rows:
+            for n, text in enumerate(row):
+                image = font.render(text, True, self.text_color, self.settings.bg_color)
+                rect = image.get_rect()
+                if n:
+                    rect.topright = self.screen_rect.left + 120 + 55 * n, top
+                else:
+                    rect.topleft = self.screen_rect.left + 10, top
+                self.profiler_images.append((image, rect))
+            top += font.get_linesize()
 
     def show_pause(self):
-        self.screen.blit(*self.pause_image)
+        return [self.screen.blit(*self.pause_image)]
 
     def show_gameover(self):
-        self.screen.blit(*self.game_over_image)
-        self.screen.blit(*self.enter_name_image)
-        self.screen.blit(*self.name_info_image)
+        rects = [
+            self.screen.blit(*self.game_over_image),
+            self.screen.blit(*self.enter_name_image),
+            self.screen.blit(*self.name_info_image),
+        ]
 
         size_x = self.name_input.surface.get_rect().width
         pos = (self.screen_rect.center[0] - size_x / 2,
                self.screen_rect.center[1])
-        self.screen.blit(self.name_input.surface, pos)
+        rects.append(self.screen.blit(self.name_input.surface, pos))
+        return rects
 
     def check_name(self):
         name = self.name_input.value